@@ -1,24 +1,61 @@
 # apps/accounts/adapters.py
 import logging
+import re
 import uuid
 from allauth.account.adapter import DefaultAccountAdapter
 from allauth.socialaccount.adapter import DefaultSocialAccountAdapter
 from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.contrib.sites.shortcuts import get_current_site
+from django.db import transaction
+from django.db.models import Q
+from apps.accounts.cache import get_social_apps
+from apps.profiles.cache import cache_profile_summary, get_profile_summary
 from apps.profiles.models import UserProfile
-import environ
-from pathlib import Path
+from apps.profiles.services.linkedin_verification import (
+    get_linkedin_verification_service,
+)
 from django.utils.encoding import force_bytes
 from django.utils.http import urlsafe_base64_encode
 from django.contrib.auth.tokens import default_token_generator
 
-BASE_DIR = Path(__file__).resolve().parent.parent
+logger = logging.getLogger(__name__)
 
-env = environ.Env()
-environ.Env.read_env(BASE_DIR / ".env")
+# Username cleaning patterns (compiled once, used on every OAuth signup)
+_NON_WORD_RE = re.compile(r"[^\w\s-]")
+_SPACE_DASH_RE = re.compile(r"[\s-]+")
 
-FRONTEND_URL = env("FRONTEND_URL")
+# User model and its optional OAuth identifier columns, resolved once at import.
+# This module is loaded lazily by allauth, after the app registry is ready.
+User = get_user_model()
+_USER_FIELD_NAMES = frozenset(f.name for f in User._meta.get_fields())
+_USER_HAS_LINKEDIN_ID = "linkedin_id" in _USER_FIELD_NAMES
+_USER_HAS_GOOGLE_ID = "google_id" in _USER_FIELD_NAMES
 
-logger = logging.getLogger(__name__)
+# OAuth name fields: full name, then first/last name in provider-preference order
+_NAME_KEYS = (("name",), ("given_name", "first_name"), ("family_name", "last_name"))
+
+
+def _resolve_name(data):
+    """
+    Resolve a display name from OAuth provider data.
+
+    Uses ``name`` when present, otherwise joins the first and last name
+    (OpenID ``given_name``/``family_name`` or legacy ``first_name``/``last_name``).
+    """
+    name, first_name, last_name = (
+        next((data[key] for key in keys if data.get(key)), "") for keys in _NAME_KEYS
+    )
+    if not name and first_name:
+        name = f"{first_name} {last_name}".strip() if last_name else first_name
+    return name
+
+
+def _set_if_changed(instance, field, value, changed):
+    """Assign ``value`` to ``instance.field`` and record ``field`` only if it differs."""
+    if getattr(instance, field) != value:
+        setattr(instance, field, value)
+        changed.add(field)
 
 
 class CustomAccountAdapter(DefaultAccountAdapter):
@@ -28,14 +65,13 @@ class CustomAccountAdapter(DefaultAccountAdapter):
     """
 
     def get_login_redirect_url(self, request):
-        logger.info(f"OAuth login complete for {request.user.email}")
+        logger.info("OAuth login complete for %s", request.user.email)
         return "/api/auth/oauth-success/"
 
     def get_signup_redirect_url(self, request):
         """Redirect to select-role after signup."""
-        logger.info(f"User {request.user.email} signed up successfully")
-        frontend_url = getattr(settings, "FRONTEND_URL", FRONTEND_URL)
-        return f"{frontend_url}/select-role/"
+        logger.info("User %s signed up successfully", request.user.email)
+        return f"{settings.FRONTEND_URL}/select-role/"
 
     def populate_username(self, request, user):
         """
@@ -49,9 +85,11 @@ class CustomAccountAdapter(DefaultAccountAdapter):
 
         # Username should already be provided by the form
         if username:
-            logger.info(f"Username '{username}' provided for user with email {email}")
+            logger.info(
+                "Username '%s' provided for user with email %s", username, email
+            )
         else:
-            logger.warning(f"No username provided for user with email {email}")
+            logger.warning("No username provided for user with email %s", email)
 
         return username
 
@@ -61,10 +99,12 @@ class CustomAccountAdapter(DefaultAccountAdapter):
         user = super().save_user(request, user, form, commit)
 
         if commit:
-            # Create user profile if it doesn't exist
-            profile, created = UserProfile.objects.get_or_create(user=user)
+            # Create user profile if it doesn't exist (only the pk is needed)
+            profile, created = UserProfile.objects.only("id").get_or_create(
+                user=user
+            )
             if created:
-                logger.info(f"Created profile for user {user.email}")
+                logger.info("Created profile for user %s", user.email)
         return user
 
 
@@ -83,20 +123,54 @@ class CustomSocialAccountAdapter(DefaultSocialAccountAdapter):
     1. save_user() - Create user + profile + store LinkedIn data + verify
     """
 
+    def list_apps(self, request, provider=None, client_id=None):
+        """
+        Cached version of allauth's SocialApp lookup.
+
+        get_app() (used on every OAuth login and callback) goes through here;
+        entries are invalidated by the SocialApp signals in signals.py.
+        """
+        site_id = get_current_site(request).pk if request else None
+        load = super().list_apps
+        return get_social_apps(
+            site_id, provider, client_id, lambda: load(request, provider, client_id)
+        )
+
     def get_login_redirect_url(self, request):
         """Return redirect based on role status."""
         if hasattr(request, "user") and request.user.is_authenticated:
-            logger.info(f"User {request.user.email} logged in via OAuth")
+            logger.info("User %s logged in via OAuth", request.user.email)
 
-        # If user has no role, redirect to select-role
-        profile, _ = UserProfile.objects.get_or_create(user=request.user)
-        if not profile.role:
-            frontend_url = getattr(settings, "FRONTEND_URL", FRONTEND_URL)
-            return f"{frontend_url}/select-role/"
+        # If user has no role, redirect to select-role. request.user is loaded
+        # with its profile by the auth backend; fall back to the cache otherwise.
+        if request.user.is_authenticated and User.profile.is_cached(request.user):
+            summary = {"role": request.user.profile.role}
+        else:
+            summary = get_profile_summary(request.user)
+        if summary is None:
+            # Only the cached summary columns are needed here
+            profile, _ = UserProfile.objects.only(
+                "user_id", "role", "is_verified_user"
+            ).get_or_create(user=request.user)
+            summary = cache_profile_summary(profile)
+        if not summary["role"]:
+            return f"{settings.FRONTEND_URL}/select-role/"
 
         # For API-first approach, return to auth-status
         return "/api/auth-status/"
 
+    def _get_profile(self, user):
+        """
+        Return the user's profile via the cached ``user.profile`` accessor.
+
+        The profile is normally created by the post_save signal, so this only
+        falls back to get_or_create when the reverse relation is missing.
+        """
+        profile = getattr(user, "profile", None)
+        if profile is None:
+            profile, _ = UserProfile.objects.get_or_create(user=user)
+        return profile
+
     def populate_user(self, request, sociallogin, data):
         """
         Populate user data from social login.
@@ -104,53 +178,59 @@ class CustomSocialAccountAdapter(DefaultSocialAccountAdapter):
         """
         user = super().populate_user(request, sociallogin, data)
 
-        # Get name and email from social account data
-        email = data.get("email", "")
-        name = data.get("name", "")
-        first_name = data.get("given_name", "") or data.get("first_name", "")
-        last_name = data.get("family_name", "") or data.get("last_name", "")
-
-        # Try to get the full name from various fields
-        if not name and first_name:
-            name = f"{first_name} {last_name}".strip() if last_name else first_name
-
         # Use the exact name as username, with fallback to email prefix
         if not user.username:
-            if name:
-                # Clean the name to make it a valid username
-                username = self._clean_username_from_name(name)
-                logger.info(
-                    f"Using exact name '{name}' as username '{username}' for OAuth user {email}"
-                )
-            elif email:
-                # Fallback to email prefix if no name available
-                username = email.split("@")[0]
-                logger.info(
-                    f"Using email prefix '{username}' for OAuth user {email} (no name available)"
-                )
-            else:
-                # Last resort fallback
-                username = f"user_{uuid.uuid4().hex[:8]}"
-                logger.info(
-                    f"Generated random username '{username}' for OAuth user (no name or email)"
-                )
-
-            # Ensure uniqueness
-            username = self._ensure_unique_username(username)
-            user.username = username
+            user.username = self._username_from_oauth_data(
+                data, data.get("email", "")
+            )
 
         return user
 
+    def _username_from_oauth_data(self, data, email):
+        """
+        Build a unique username from OAuth provider data.
+
+        Prefers the cleaned display name, then the email prefix, then a
+        random ``user_<hex>`` fallback.
+        """
+        name = _resolve_name(data)
+
+        if name:
+            # Clean the name to make it a valid username
+            username = self._clean_username_from_name(name)
+            logger.info(
+                "Using exact name '%s' as username '%s' for OAuth user %s",
+                name,
+                username,
+                email,
+            )
+        elif email:
+            # Fallback to email prefix if no name available
+            username = email.split("@")[0]
+            logger.info(
+                "Using email prefix '%s' for OAuth user %s (no name available)",
+                username,
+                email,
+            )
+        else:
+            # Last resort fallback
+            username = f"user_{uuid.uuid4().hex[:8]}"
+            logger.info(
+                "Generated random username '%s' for OAuth user (no name or email)",
+                username,
+            )
+
+        # Ensure uniqueness
+        return self._ensure_unique_username(username)
+
     def _clean_username_from_name(self, name):
         """
         Clean a name to make it a valid username.
         Removes special characters and spaces, keeps only alphanumeric and basic chars.
         """
-        import re
-
         # Replace spaces with underscores and remove special characters
-        username = re.sub(r"[^\w\s-]", "", name.lower())
-        username = re.sub(r"[\s-]+", "_", username)
+        username = _NON_WORD_RE.sub("", name.lower())
+        username = _SPACE_DASH_RE.sub("_", username)
         # Remove leading/trailing underscores
         username = username.strip("_")
         # Ensure it's not empty
@@ -161,16 +241,27 @@ class CustomSocialAccountAdapter(DefaultSocialAccountAdapter):
     def _ensure_unique_username(self, base_username):
         """
         Ensure username is unique by appending numbers if needed.
-        """
-        from django.contrib.auth import get_user_model
 
-        User = get_user_model()
+        Fetches every username sharing the base prefix in a single query
+        and picks the next free suffix in memory, instead of probing the
+        database once per candidate.
+        """
+        # Match only the base name and its "_<n>" variants so unrelated names
+        # sharing the prefix (e.g. "john" vs "johnny") are not fetched
+        existing = set(
+            User.objects.filter(
+                Q(username=base_username)
+                | Q(username__startswith=f"{base_username}_")
+            ).values_list("username", flat=True)
+        )
+        if base_username not in existing:
+            return base_username
 
-        username = base_username
         counter = 1
-        while User.objects.filter(username=username).exists():
-            username = f"{base_username}_{counter}"
+        username = f"{base_username}_{counter}"
+        while username in existing:
             counter += 1
+            username = f"{base_username}_{counter}"
 
         return username
 
@@ -179,86 +270,103 @@ class CustomSocialAccountAdapter(DefaultSocialAccountAdapter):
         Helper method to update LinkedIn profile data.
         Called from both save_user() and pre_social_login().
 
+        Does NOT save the profile or the user - callers persist each once
+        with ``save(update_fields=...)`` using the returned field names.
+
         Args:
             profile: UserProfile instance
             user: User instance
             extra_data: Dict of LinkedIn OAuth data
 
         Returns:
-            bool: True if data was updated
+            tuple: (profile_fields: set, user_fields: set) of fields whose
+            value actually changed; both are empty for an unchanged
+            returning user, so callers can skip the write entirely
         """
-        profile.oauth_provider = "linkedin"
+        user_changed = set()
+        changed = set()
+        _set_if_changed(profile, "oauth_provider", "linkedin", changed)
 
         # LinkedIn OpenID Connect data structure - extract comprehensive profile data
         if "picture" in extra_data:
-            profile.profile_picture_url = extra_data["picture"]
+            _set_if_changed(
+                profile, "profile_picture_url", extra_data["picture"], changed
+            )
         elif "pictureUrl" in extra_data:
-            profile.profile_picture_url = extra_data["pictureUrl"]
+            _set_if_changed(
+                profile, "profile_picture_url", extra_data["pictureUrl"], changed
+            )
 
         # Get LinkedIn ID
         if "sub" in extra_data:
-            profile.linkedin_id = extra_data["sub"]
-            if hasattr(user, "linkedin_id"):
-                user.linkedin_id = extra_data["sub"]
-                user.save(update_fields=["linkedin_id"])
+            _set_if_changed(profile, "linkedin_id", extra_data["sub"], changed)
+            if _USER_HAS_LINKEDIN_ID:
+                _set_if_changed(user, "linkedin_id", extra_data["sub"], user_changed)
         elif "id" in extra_data:
-            profile.linkedin_id = extra_data["id"]
-            if hasattr(user, "linkedin_id"):
-                user.linkedin_id = extra_data["id"]
-                user.save(update_fields=["linkedin_id"])
+            _set_if_changed(profile, "linkedin_id", extra_data["id"], changed)
+            if _USER_HAS_LINKEDIN_ID:
+                _set_if_changed(user, "linkedin_id", extra_data["id"], user_changed)
 
         # Get profile URL
         if "publicProfileUrl" in extra_data:
-            profile.linkedin_profile_url = extra_data["publicProfileUrl"]
+            _set_if_changed(
+                profile, "linkedin_profile_url", extra_data["publicProfileUrl"], changed
+            )
         elif "public_profile_url" in extra_data:
-            profile.linkedin_profile_url = extra_data["public_profile_url"]
+            _set_if_changed(
+                profile,
+                "linkedin_profile_url",
+                extra_data["public_profile_url"],
+                changed,
+            )
 
         # Get full name from LinkedIn
-        name = extra_data.get("name", "")
-        first_name = extra_data.get("given_name", "") or extra_data.get(
-            "first_name", ""
-        )
-        last_name = extra_data.get("family_name", "") or extra_data.get("last_name", "")
-
-        if not name and first_name:
-            name = f"{first_name} {last_name}".strip() if last_name else first_name
+        name = _resolve_name(extra_data)
 
         if name:
-            profile.linkedin_full_name = name[:200]
+            _set_if_changed(profile, "linkedin_full_name", name[:200], changed)
             # Also set name if not already set
             if not profile.name:
-                profile.name = name[:100]
+                _set_if_changed(profile, "name", name[:100], changed)
+
+        # Bind each source value once; slices are taken from the local
+        headline = extra_data.get("headline")
+        position = extra_data.get("position")
+        company = extra_data.get("company")
 
         # Get headline
-        if "headline" in extra_data:
-            profile.linkedin_headline = extra_data["headline"][:300]
+        if headline is not None:
+            _set_if_changed(profile, "linkedin_headline", headline[:300], changed)
             # Also use as bio if not set
             if not profile.bio:
-                profile.bio = extra_data["headline"][:500]
+                _set_if_changed(profile, "bio", headline[:500], changed)
 
         # Current position/designation
-        if "headline" in extra_data and not profile.designation:
-            profile.designation = extra_data["headline"][:100]
-            profile.current_position = extra_data["headline"][:100]
-        elif "position" in extra_data:
-            profile.designation = extra_data["position"][:100]
-            profile.current_position = extra_data["position"][:100]
+        if headline is not None and not profile.designation:
+            designation = headline[:100]
+        elif position is not None:
+            designation = position[:100]
+        else:
+            designation = None
+        if designation is not None:
+            _set_if_changed(profile, "designation", designation, changed)
+            _set_if_changed(profile, "current_position", designation, changed)
 
         # Company from LinkedIn (if available)
-        if "company" in extra_data:
-            profile.linkedin_company = extra_data["company"][:200]
+        if company is not None:
+            _set_if_changed(profile, "linkedin_company", company[:200], changed)
             if not profile.company:
-                profile.company = extra_data["company"][:150]
+                _set_if_changed(profile, "company", company[:150], changed)
 
         # Store LinkedIn email (may differ from user's primary email)
         if "email" in extra_data:
-            profile.linkedin_email = extra_data["email"]
+            _set_if_changed(profile, "linkedin_email", extra_data["email"], changed)
 
         # Experience years - set default if not available
         if not profile.experience_years:
-            profile.experience_years = 0
+            _set_if_changed(profile, "experience_years", 0, changed)
 
-        return True
+        return changed, user_changed
 
     def _trigger_linkedin_verification(self, profile, user, linkedin_email=None):
         """
@@ -284,49 +392,47 @@ class CustomSocialAccountAdapter(DefaultSocialAccountAdapter):
         """
         # Skip if already verified
         if profile.is_verified_user:
-            logger.debug(f"User {user.email} already verified, skipping")
+            logger.debug("User %s already verified, skipping", user.email)
             return True, "Already verified"
 
         # Check if user has taker role - ONLY takers can be auto-verified
         if not profile.is_taker():
-            logger.debug(f"User {user.email} is not a taker, skipping verification")
+            logger.debug("User %s is not a taker, skipping verification", user.email)
             return False, "Verify your profile by signing in once via LinkedIn"
 
         # Check LinkedIn connection exists
         has_linkedin = profile.oauth_provider == "linkedin" or bool(profile.linkedin_id)
 
         if not has_linkedin:
-            logger.debug(f"User {user.email} has no LinkedIn connection")
+            logger.debug("User %s has no LinkedIn connection", user.email)
             return False, "Verify your profile by signing in once via LinkedIn"
 
         # OPTIONAL: Email matching check (relaxed - only warn, don't block)
         # The LinkedIn email might differ from registration email
         if linkedin_email and linkedin_email != user.email:
             logger.warning(
-                f"LinkedIn email ({linkedin_email}) differs from user email ({user.email}) - "
-                f"proceeding with verification anyway"
+                "LinkedIn email (%s) differs from user email (%s) - "
+                "proceeding with verification anyway",
+                linkedin_email,
+                user.email,
             )
 
         # All conditions met - auto-verify!
         try:
-            from apps.profiles.services.linkedin_verification import (
-                get_linkedin_verification_service,
-            )
-
             service = get_linkedin_verification_service()
             is_verified, reasons = service.verify_linkedin_user(profile)
 
             if is_verified:
-                logger.info(f"User {user.email} auto-verified as expert via LinkedIn")
+                logger.info("User %s auto-verified as expert via LinkedIn", user.email)
                 return True, "Verified via LinkedIn"
             else:
-                logger.debug(f"User {user.email} not verified: {', '.join(reasons)}")
+                logger.debug(
+                    "User %s not verified: %s", user.email, ", ".join(reasons)
+                )
                 return False, reasons[0] if reasons else "Verification failed"
 
         except Exception as e:
-            logger.error(
-                f"Error during LinkedIn verification for {user.email}: {str(e)}"
-            )
+            logger.error("Error during LinkedIn verification for %s: %s", user.email, e)
             return False, f"Verification error: {str(e)}"
 
     def save_user(self, request, sociallogin, form=None):
@@ -336,75 +442,55 @@ class CustomSocialAccountAdapter(DefaultSocialAccountAdapter):
         NOTE: This method is ONLY called for NEW user signups via OAuth.
         For EXISTING users logging in, see pre_social_login().
         """
-        # Ensure username is set before saving
+        # Username is normally set by populate_user(); only rebuild it if missing
         user = sociallogin.user
         if not user.username:
-            email = user.email or sociallogin.account.extra_data.get("email", "")
-            extra_data = sociallogin.account.extra_data
-
-            # Get name from OAuth data
-            name = extra_data.get("name", "")
-            first_name = extra_data.get("given_name", "") or extra_data.get(
-                "first_name", ""
-            )
-            last_name = extra_data.get("family_name", "") or extra_data.get(
-                "last_name", ""
+            logger.warning("OAuth user reached save_user without a username")
+            user.username = self._username_from_oauth_data(
+                sociallogin.account.extra_data,
+                user.email or sociallogin.account.extra_data.get("email", ""),
             )
 
-            # Try to get the full name from various fields
-            if not name and first_name:
-                name = f"{first_name} {last_name}".strip() if last_name else first_name
-
-            if name:
-                username = self._clean_username_from_name(name)
-                logger.info(
-                    f"Using exact name '{name}' as username '{username}' for OAuth user {email}"
-                )
-            elif email:
-                username = email.split("@")[0]
-                logger.info(
-                    f"Using email prefix '{username}' for OAuth user {email} (no name available)"
-                )
-            else:
-                username = f"user_{uuid.uuid4().hex[:8]}"
-                logger.info(f"Generated random username '{username}' for OAuth user")
-
-            # Ensure uniqueness
-            user.username = self._ensure_unique_username(username)
+        # Stage the Google ID so it is written by the user INSERT below
+        extra_data = sociallogin.account.extra_data
+        if (
+            sociallogin.account.provider == "google"
+            and _USER_HAS_GOOGLE_ID
+            and "sub" in extra_data
+        ):
+            user.google_id = extra_data["sub"]
 
         user = super().save_user(request, sociallogin, form)
 
         # Always update profile data on every login (not just creation)
-        profile, created = UserProfile.objects.get_or_create(user=user)
+        profile = self._get_profile(user)
 
         # Extract provider-specific data
         provider = sociallogin.account.provider
-        extra_data = sociallogin.account.extra_data
 
-        logger.info(
-            f"Processing OAuth data for provider: {provider} (new user: {created})"
-        )
-        logger.debug(f"Extra data keys: {list(extra_data.keys())}")
+        logger.info("Processing OAuth data for provider: %s", provider)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Extra data keys: %s", list(extra_data.keys()))
+
+        changed = set()
 
         if provider == "google":
             profile.oauth_provider = "google"
+            changed.add("oauth_provider")
             if "picture" in extra_data:
                 profile.profile_picture_url = extra_data["picture"]
-            # Store Google ID
-            if "sub" in extra_data:
-                if hasattr(user, "google_id"):
-                    user.google_id = extra_data["sub"]
-                    user.save(update_fields=["google_id"])
-            logger.info(f"Updated Google profile data for user {user.email}")
+                changed.add("profile_picture_url")
+            # google_id was already persisted with the user INSERT above
+            logger.info("Updated Google profile data for user %s", user.email)
 
         elif provider in ["linkedin", "linkedin_oauth2", "openid_connect"]:
-            logger.info(f"Processing LinkedIn OAuth data for NEW user {user.email}")
-
-            # Update LinkedIn profile data
-            self._update_linkedin_profile_data(profile, user, extra_data)
+            logger.info("Processing LinkedIn OAuth data for NEW user %s", user.email)
 
-            # Save profile first before verification
-            profile.save()
+            # Update LinkedIn profile data (persisted below in a single write;
+            # verification saves its own fields via verify_user())
+            changed, user_changed = self._update_linkedin_profile_data(
+                profile, user, extra_data
+            )
 
             # Trigger verification for taker role users
             linkedin_email = extra_data.get("email")
@@ -413,19 +499,23 @@ class CustomSocialAccountAdapter(DefaultSocialAccountAdapter):
             )
 
             logger.info(
-                f"LinkedIn verification result for {user.email}: "
-                f"verified={is_verified}, message={message}"
+                "LinkedIn verification result for %s: verified=%s, message=%s",
+                user.email,
+                is_verified,
+                message,
             )
 
-        # Always save profile data to database
-        profile.save()
+            # Persist staged user fields (linkedin_id) in one UPDATE
+            if user_changed:
+                user.save(update_fields=list(user_changed))
 
-        if created:
-            logger.info(f"Created profile for OAuth user {user.email} via {provider}")
-        else:
-            logger.info(
-                f"Updated existing profile for OAuth user {user.email} via {provider}"
-            )
+        # Persist OAuth-sourced profile data in one UPDATE; other providers
+        # leave the profile untouched, so nothing is written for them
+        if changed:
+            profile.save(update_fields=[*changed, "updated_at"])
+        cache_profile_summary(profile)
+
+        logger.info("Saved profile for OAuth user %s via %s", user.email, provider)
 
         return user
 
@@ -445,20 +535,19 @@ class CustomSocialAccountAdapter(DefaultSocialAccountAdapter):
         extra_data = sociallogin.account.extra_data
         email = extra_data.get("email", "unknown")
 
-        logger.info(f"OAuth pre_social_login: provider={provider}, email={email}")
+        logger.info("OAuth pre_social_login: provider=%s, email=%s", provider, email)
 
         # Try to connect to existing user with same email
         existing_user = None
         if email and email != "unknown":
-            from apps.accounts.models import User
-
-            try:
-                existing_user = User.objects.get(email=email)
+            # Emails are stored lowercased, so plain equality hits the unique index
+            existing_user = User.objects.filter(email=email.lower()).first()
+            if existing_user is not None:
                 if not sociallogin.is_existing:
                     sociallogin.connect(request, existing_user)
-                    logger.info(f"Connected OAuth account to existing user {email}")
-            except User.DoesNotExist:
-                logger.debug(f"No existing user found for email {email}")
+                    logger.info("Connected OAuth account to existing user %s", email)
+            else:
+                logger.debug("No existing user found for email %s", email)
 
         # ========== EXISTING USER LINKEDIN VERIFICATION ==========
         # For EXISTING users logging in via LinkedIn, save_user() is NOT called.
@@ -468,33 +557,54 @@ class CustomSocialAccountAdapter(DefaultSocialAccountAdapter):
             "linkedin_oauth2",
             "openid_connect",
         ]:
-            logger.info(f"Processing LinkedIn login for EXISTING user {email}")
+            logger.info("Processing LinkedIn login for EXISTING user %s", email)
+
+            # Apply all LinkedIn writes atomically, holding a row lock on the
+            # profile so concurrent logins for the same user cannot interleave
+            with transaction.atomic():
+                profile = (
+                    UserProfile.objects.select_for_update()
+                    .filter(user=existing_user)
+                    .first()
+                ) or self._get_profile(existing_user)
+
+                # Update LinkedIn profile data
+                changed, user_changed = self._update_linkedin_profile_data(
+                    profile, existing_user, extra_data
+                )
 
-            # Get or create profile
-            profile, _ = UserProfile.objects.get_or_create(user=existing_user)
+                logger.debug(
+                    "Updated LinkedIn data for %s: linkedin_id=%s, linkedin_email=%s",
+                    email,
+                    profile.linkedin_id,
+                    profile.linkedin_email,
+                )
 
-            # Update LinkedIn profile data
-            self._update_linkedin_profile_data(profile, existing_user, extra_data)
+                # Save profile before verification (skipped when nothing changed,
+                # so returning users with up-to-date data perform no writes)
+                if changed:
+                    profile.save(update_fields=[*changed, "updated_at"])
 
-            logger.debug(
-                f"Updated LinkedIn data for {email}: "
-                f"linkedin_id={profile.linkedin_id}, "
-                f"linkedin_email={profile.linkedin_email}"
-            )
+                # Trigger verification for taker role users
+                # This is the KEY FIX - existing users get verified here!
+                linkedin_email = extra_data.get("email")
+                is_verified, message = self._trigger_linkedin_verification(
+                    profile, existing_user, linkedin_email
+                )
 
-            # Save profile before verification
-            profile.save()
+                logger.info(
+                    "LinkedIn verification result for EXISTING user %s: "
+                    "verified=%s, message=%s",
+                    email,
+                    is_verified,
+                    message,
+                )
 
-            # Trigger verification for taker role users
-            # This is the KEY FIX - existing users get verified here!
-            linkedin_email = extra_data.get("email")
-            is_verified, message = self._trigger_linkedin_verification(
-                profile, existing_user, linkedin_email
-            )
+                # Persist staged user fields (linkedin_id) in one UPDATE
+                if user_changed:
+                    existing_user.save(update_fields=list(user_changed))
 
-            logger.info(
-                f"LinkedIn verification result for EXISTING user {email}: "
-                f"verified={is_verified}, message={message}"
-            )
+            # Warm the profile cache for get_login_redirect_url()
+            cache_profile_summary(profile)
 
         super().pre_social_login(request, sociallogin)
@@ -1,7 +1,25 @@
 # apps/accounts/api.py
+import hashlib
+import json
 import logging
-from django.contrib.auth import authenticate, get_user_model, logout as django_logout
+import re
+import time
+from django.conf import settings
+from django.contrib.auth import (
+    authenticate,
+    get_user_model,
+    logout as django_logout,
+)
+from django.contrib.auth.password_validation import validate_password
+from django.contrib.auth.tokens import default_token_generator
+from django.core.exceptions import ValidationError
+from django.db import transaction
+from django.db.models import Q
+from django.http import HttpResponse, HttpResponseNotModified, HttpResponseRedirect
 from django.shortcuts import redirect
+from django.urls import reverse
+from django.utils.cache import patch_cache_control
+from django.utils.http import parse_etags, quote_etag, urlsafe_base64_decode
 from django.views.decorators.csrf import csrf_exempt
 from rest_framework.decorators import api_view, permission_classes
 from rest_framework.permissions import AllowAny, IsAuthenticated
@@ -10,53 +28,83 @@ from rest_framework_simplejwt.tokens import RefreshToken
 from rest_framework_simplejwt.views import TokenRefreshView
 from drf_yasg.utils import swagger_auto_schema
 from drf_yasg import openapi
+from allauth.account.adapter import get_adapter
+from allauth.account.models import EmailAddress, EmailConfirmation
+from allauth.account.utils import user_email
+from allauth.account.views import ConfirmEmailView
+from apps.profiles.cache import get_payload_version
 from apps.profiles.models import UserProfile
+from .cache import (
+    cache_verified_email,
+    get_verified_email,
+    invalidate_verified_email,
+)
+from .decorators import email_rate_limited
+from .forms import FrontendResetPasswordForm
 from .serializers import (
     LoginRequestSerializer,
     SignupRequestSerializer,
     AuthResponseSerializer,
     LogoutResponseSerializer,
     AuthStatusResponseSerializer,
-    UserPayloadSerializer,
 )
-from allauth.account.models import EmailAddress
-from allauth.account.adapter import get_adapter
-from allauth.account.utils import user_email
-from allauth.account.models import EmailAddress
-
+from .tasks import queue_email_confirmation, queue_refresh_token_blacklist
 
-from django.contrib.auth import authenticate
-from rest_framework.decorators import api_view, permission_classes
-from rest_framework.permissions import AllowAny
-from rest_framework.response import Response
-from allauth.account.models import EmailAddress
-from django.contrib.auth import get_user_model
+logger = logging.getLogger(__name__)
+User = get_user_model()
 
-from allauth.account.views import ConfirmEmailView
-from django.http import HttpResponseRedirect
-from django.urls import reverse
-from allauth.account.models import EmailConfirmation
+# Structural email check (local@domain.tld, RFC 5321 length limits) used to
+# drop malformed input before it reaches the database
+_EMAIL_RE = re.compile(r"^[^@\s]{1,64}@[^@\s]{1,255}\.[^@\s]{1,63}$")
 
-from django.conf import settings
 
-logger = logging.getLogger(__name__)
-User = get_user_model()
+def _canon_email(raw):
+    """
+    Return the stripped, lowercased email, or None if it is not shaped like
+    an address. lower() (not casefold()) matches how User and allauth's
+    EmailAddress store emails.
+    """
+    email = str(raw or "").strip().lower()
+    if len(email) <= 254 and _EMAIL_RE.match(email):
+        return email
+    return None
 
 # --------------------------------------------------
 # Utilities & Health Check
 # --------------------------------------------------
 
+# Static JSON bodies, serialized once at import instead of on every request
+_HEALTH_JSON = json.dumps(
+    {"status": "healthy", "message": "Interview Platform Backend is running"}
+).encode()
+
+_AUTH_ENDPOINTS_JSON = json.dumps(
+    {
+        "login": "/accounts/login/",
+        "signup": "/accounts/signup/",
+        "google_oauth": "/accounts/google/login/",
+        "linkedin_oauth": "/accounts/linkedin_oauth2/login/",
+        "logout": "/accounts/logout/",
+        "token_refresh": "/api/token/refresh/",
+        "auth_status": "/api/auth-status/",
+    }
+).encode()
+
 
 @api_view(["GET"])
 @permission_classes([AllowAny])
 def health_check(request):
     """Simple health check endpoint."""
-    return Response(
-        {"status": "healthy", "message": "Interview Platform Backend is running"}
-    )
+    return HttpResponse(_HEALTH_JSON, content_type="application/json")
 
 
 def issue_tokens(user):
+    """
+    Issue a refresh/access token pair for ``user``.
+
+    simplejwt signs through one module-level TokenBackend whose signing key
+    is prepared once at import, so no per-call key parsing happens here.
+    """
     refresh = RefreshToken.for_user(user)
     return {
         "access": str(refresh.access_token),
@@ -64,28 +112,45 @@ def issue_tokens(user):
     }
 
 
+def _get_or_create_profile(user):
+    """
+    Return ``user.profile``, creating it only if it is genuinely missing.
+
+    The profile is created by the User post_save signal and usually arrives
+    joined on request.user, so the common case costs no query at all
+    (get_or_create would always SELECT inside a savepoint).
+    """
+    try:
+        return user.profile
+    except UserProfile.DoesNotExist:
+        profile, _ = UserProfile.objects.get_or_create(user=user)
+        return profile
+
+
 def user_payload(user):
     """
     Generate user payload for API responses.
     Updated to support multi-role users and onboarding status.
     """
-    profile, _ = UserProfile.objects.get_or_create(user=user)
+    profile = _get_or_create_profile(user)
 
-    # Get list of role names for multi-role support
+    # Role and onboarding lookups are computed once and reused below
+    # (equivalent to get_role_names/has_any_role/get_effective_role)
     roles = profile.get_role_names()
+    has_role = bool(roles)
+    if roles:
+        effective_role = roles[0]
+    elif profile.new_role_id:
+        effective_role = profile.new_role.name
+    else:
+        effective_role = profile.role
 
     # Get onboarding status
-    onboarding_status = (
-        profile.get_onboarding_status() if profile.has_any_role() else {}
-    )
-
-    if not profile.public_id:
-        import uuid
+    onboarding_status = profile.get_onboarding_status() if has_role else {}
+    pending_steps = onboarding_status.get("pending_steps", [])
+    onboarding_required = bool(pending_steps)
 
-        profile.public_id = uuid.uuid4()
-        profile.save(update_fields=["public_id"])
-
-    return {
+    payload = {
         "id": user.id,
         "uuid": profile.public_id,
         "username": user.username,
@@ -98,9 +163,9 @@ def user_payload(user):
         # NEW: List of roles for multi-role support
         "roles": roles,
         # DEPRECATED: Single role for backward compatibility
-        "role": profile.get_effective_role(),
+        "role": effective_role,
         # Updated to check for any role
-        "has_role": profile.has_any_role(),
+        "has_role": has_role,
         # NEW: Admin status
         "is_admin": user.is_staff or user.is_superuser,
         "is_staff": user.is_staff,
@@ -120,19 +185,73 @@ def user_payload(user):
         "profile_complete": profile.onboarding_completed,
         # ========== ONBOARDING STATUS ==========
         "onboarding_completed": profile.onboarding_completed,
-        "onboarding_required": (
-            profile.is_onboarding_required() if profile.has_any_role() else False
-        ),
-        "pending_onboarding_steps": onboarding_status.get("pending_steps", []),
+        "onboarding_required": onboarding_required,
+        "pending_onboarding_steps": pending_steps,
         "onboarding_progress": onboarding_status.get("progress_percentage", 0),
     }
 
+    # Same self-healing as UserProfile.is_onboarding_required(): reset a stale
+    # completion flag when data-driven validation finds pending steps
+    if onboarding_required and profile.onboarding_completed:
+        profile.onboarding_completed = False
+        profile.save(update_fields=["onboarding_completed"])
+
+    return payload
+
 
 # --------------------------------------------------
 # Email / Password Auth
 # --------------------------------------------------
 
 
+def _check_login_email(email):
+    """
+    Check a login email against the database (steps 1-3 of login_api).
+
+    Returns ``(user, None)`` when the address is verified (activating its
+    user if needed and caching the result), or ``(user_or_None, response)``
+    with the 401/403 response to return.
+    """
+    # 🔹 Step 1 + 2: Load the email address and its user in one JOIN
+    # (verified rows first, so a verified address wins over stale duplicates)
+    email_obj = (
+        EmailAddress.objects.select_related("user")
+        # Only the columns the checks below read
+        .only("verified", "user__username", "user__password", "user__is_active")
+        .filter(email=email)
+        .order_by("-verified")
+        .first()
+    )
+
+    if email_obj is None:
+        logger.warning(f"Login attempt with unknown email: {email}")
+        return None, Response(
+            {"success": False, "error": "Invalid credentials"}, status=401
+        )
+
+    user = email_obj.user
+
+    if not email_obj.verified:
+        logger.warning(f"Login attempt with unverified email: {email}")
+        return user, Response(
+            {
+                "success": False,
+                "error": "Please verify your email before logging in",
+                "code": "email_not_verified",
+            },
+            status=403,
+        )
+
+    # 🔹 Step 3: Ensure user is active
+    if not user.is_active:
+        user.is_active = True
+        user.save(update_fields=["is_active"])
+        logger.info(f"Activated user: {user.username}")
+
+    cache_verified_email(email, user.pk)
+    return user, None
+
+
 @swagger_auto_schema(
     method="post",
     request_body=LoginRequestSerializer,
@@ -173,51 +292,38 @@ def login_api(request):
             status=400,
         )
 
-    email = serializer.validated_data["email"]
+    # Stored emails are lowercase (User.save / allauth), so match them exactly
+    email = serializer.validated_data["email"].lower()
     password = serializer.validated_data["password"]
 
-    # 🔹 Step 1: Check if user exists
-    try:
-        user = User.objects.get(email=email)
-    except User.DoesNotExist:
-        logger.warning(f"Login attempt with non-existent email: {email}")
-        return Response({"success": False, "error": "Invalid credentials"}, status=401)
-
-    # 🔹 Step 2: Check if email is verified
-    email_obj = EmailAddress.objects.filter(
-        user=user, email=email, verified=True
-    ).first()
-
-    if not email_obj:
-        logger.warning(f"Login attempt with unverified email: {email}")
-        # Check if email exists but is unverified
-        unverified = EmailAddress.objects.filter(
-            user=user, email=email, verified=False
-        ).exists()
-        if unverified:
-            return Response(
-                {
-                    "success": False,
-                    "error": "Please verify your email before logging in",
-                    "code": "email_not_verified",
-                },
-                status=403,
-            )
-        return Response({"success": False, "error": "Invalid credentials"}, status=401)
-
-    # 🔹 Step 3: Ensure user is active
-    if not user.is_active:
-        user.is_active = True
-        user.save(update_fields=["is_active"])
-        logger.info(f"Activated user: {user.username}")
+    # 🔹 Step 1-3 fast path: verified email of an active user, from cache.
+    # Anything else (unknown, unverified, inactive) goes to the database.
+    user = None
+    cached = get_verified_email(email)
+    if cached is None:
+        user, error_response = _check_login_email(email)
+        if error_response is not None:
+            return error_response
 
     # 🔹 Step 4: Authenticate with custom backend
     authenticated_user = authenticate(request=request, email=email, password=password)
 
+    if authenticated_user and cached is not None and cached["user_id"] != authenticated_user.pk:
+        # The cached entry belongs to another user (address moved since);
+        # run the database checks for this login instead
+        invalidate_verified_email(email)
+        user, error_response = _check_login_email(email)
+        if error_response is not None:
+            return error_response
+
     if not authenticated_user:
         logger.warning(f"Authentication failed for email: {email}")
-        # Double-check the password manually for debugging
-        if user.check_password(password):
+        # The cached entry may be stale (e.g. user deactivated since); make
+        # the next attempt re-check the database.
+        invalidate_verified_email(email)
+        # Double-check the password manually for debugging. This costs a
+        # second full password hash per failed login, so only in DEBUG.
+        if settings.DEBUG and user is not None and user.check_password(password):
             logger.error(
                 f"Password is correct but authenticate() returned None for {email}"
             )
@@ -277,22 +383,31 @@ def signup_api(request):
         )
 
     username = serializer.validated_data["username"]
-    email = serializer.validated_data["email"]
+    # Stored emails are lowercase (User.save / allauth), so match them exactly
+    email = serializer.validated_data["email"].lower()
     password = serializer.validated_data["password"]
 
-    from allauth.account.models import EmailAddress
+    # One query for both conflicts: users matching the email or the username
+    candidates = list(
+        User.objects.filter(Q(email=email) | Q(username=username)).values(
+            "id", "email", "username"
+        )
+    )
+    existing_user_id = next(
+        (c["id"] for c in candidates if c["email"] == email), None
+    )
 
     # ------------------------------------------------
     # Case 1: Email already exists
     # ------------------------------------------------
-    existing_user = User.objects.filter(email=email).first()
-    if existing_user:
-        email_address = EmailAddress.objects.filter(
-            user=existing_user,
+    if existing_user_id:
+        email_address, _ = EmailAddress.objects.get_or_create(
+            user_id=existing_user_id,
             email=email,
-        ).first()
+            defaults={"verified": False, "primary": True},
+        )
 
-        if email_address and email_address.verified:
+        if email_address.verified:
             return Response(
                 {
                     "success": False,
@@ -301,13 +416,7 @@ def signup_api(request):
                 status=400,
             )
 
-        email_address, _ = EmailAddress.objects.get_or_create(
-            user=existing_user,
-            email=email,
-            defaults={"verified": False, "primary": True},
-        )
-
-        email_address.send_confirmation(request)  # ✅ ONLY THIS
+        queue_email_confirmation(email_address, request)
 
         return Response(
             {
@@ -320,7 +429,7 @@ def signup_api(request):
     # ------------------------------------------------
     # Case 2: New user
     # ------------------------------------------------
-    if User.objects.filter(username=username).exists():
+    if any(c["username"] == username for c in candidates):
         return Response(
             {"success": False, "error": "Username already taken"},
             status=400,
@@ -330,23 +439,26 @@ def signup_api(request):
     # SECURITY: User.objects.create_user() automatically hashes the password
     # using Django's default PBKDF2 algorithm. Plaintext passwords are NEVER stored.
     # DO NOT replace this with User.objects.create() as that would store raw passwords!
-    user = User.objects.create_user(
-        username=username,
-        email=email,
-        password=password,
-        # is_active=False,
-    )
+    # User, profile and email address are written in one transaction (one
+    # commit instead of three); the email is queued once it has committed.
+    with transaction.atomic():
+        user = User.objects.create_user(
+            username=username,
+            email=email,
+            password=password,
+            # is_active=False,
+        )
 
-    UserProfile.objects.get_or_create(user=user)
+        # The profile is created by the post_save signal in accounts/signals.py
 
-    email_address = EmailAddress.objects.create(
-        user=user,
-        email=email,
-        verified=False,
-        primary=True,
-    )
+        email_address = EmailAddress.objects.create(
+            user=user,
+            email=email,
+            verified=False,
+            primary=True,
+        )
 
-    email_address.send_confirmation(request)  # ✅ ONLY THIS
+        queue_email_confirmation(email_address, request)
 
     return Response(
         {
@@ -422,7 +534,6 @@ def oauth_success(request):
     if not request.user.is_authenticated:
         return redirect(f"{frontend_url}/login?error=oauth")
 
-    profile, _ = UserProfile.objects.get_or_create(user=request.user)
     tokens = issue_tokens(request.user)
 
     logging.info("Inside oauth success")
@@ -487,13 +598,36 @@ def auth_status(request):
     if not request.user.is_authenticated:
         return Response({"authenticated": False})
 
-    return Response(
-        {
-            "authenticated": True,
-            "user": user_payload(request.user),
-        }
+    # The SPA polls this endpoint; answer 304 when nothing user_payload reads
+    # has changed. request.user and its profile are loaded fresh for every
+    # request, so their column values go straight into the ETag; the cached
+    # payload version covers roles and the role-specific profiles.
+    user = request.user
+    profile = _get_or_create_profile(user)
+    fingerprint = repr(
+        (
+            [getattr(user, f.attname) for f in user._meta.concrete_fields],
+            [getattr(profile, f.attname) for f in profile._meta.concrete_fields],
+            get_payload_version(profile.pk),
+        )
+    )
+    etag = quote_etag(
+        hashlib.blake2s(fingerprint.encode(), digest_size=16).hexdigest()
     )
 
+    if etag in parse_etags(request.headers.get("If-None-Match", "")):
+        response = HttpResponseNotModified()
+    else:
+        response = Response(
+            {
+                "authenticated": True,
+                "user": user_payload(user),
+            }
+        )
+    response["ETag"] = etag
+    patch_cache_control(response, private=True, no_cache=True)
+    return response
+
 
 @swagger_auto_schema(
     method="post",
@@ -512,16 +646,14 @@ def auth_status(request):
 @permission_classes([AllowAny])
 def logout_api(request):
     """API endpoint for logout. Blacklists refresh token and clears Django session."""
-    from rest_framework_simplejwt.tokens import RefreshToken
-
     refresh_token = request.data.get("refresh_token")
     if refresh_token:
         try:
+            # Validate inline (signature/expiry, no DB); the blacklist writes
+            # happen on a Celery worker when one is configured
             token = RefreshToken(refresh_token)
-            token.blacklist()
-            logger.info(
-                f"Successfully blacklisted refresh token for user: {request.user}"
-            )
+            queue_refresh_token_blacklist(token)
+            logger.info(f"Refresh token blacklisted for user: {request.user}")
         except Exception as e:
             logger.warning(f"Failed to blacklist token: {e}")
 
@@ -573,17 +705,7 @@ class DecoratedTokenRefreshView(TokenRefreshView):
 @api_view(["GET"])
 @permission_classes([AllowAny])
 def auth_endpoints(request):
-    return Response(
-        {
-            "login": "/accounts/login/",
-            "signup": "/accounts/signup/",
-            "google_oauth": "/accounts/google/login/",
-            "linkedin_oauth": "/accounts/linkedin_oauth2/login/",
-            "logout": "/accounts/logout/",
-            "token_refresh": "/api/token/refresh/",
-            "auth_status": "/api/auth-status/",
-        }
-    )
+    return HttpResponse(_AUTH_ENDPOINTS_JSON, content_type="application/json")
 
 
 # --------------------------------------------------
@@ -649,13 +771,15 @@ def resend_verification_api(request):
     """
     Resend email verification link.
     - Does not reveal whether email exists (security)
-    - Uses allauth's send_confirmation()
+    - Uses allauth's send_confirmation() (on a Celery worker when configured)
     """
-    email = request.data.get("email", "").strip().lower()
+    raw_email = request.data.get("email", "")
 
-    if not email:
+    if not str(raw_email).strip():
         return Response({"success": False, "error": "Email is required"}, status=400)
 
+    email = _canon_email(raw_email)
+
     # Generic success message (no user enumeration)
     success_response = Response(
         {
@@ -664,35 +788,42 @@ def resend_verification_api(request):
         }
     )
 
+    # Malformed input and abusive traffic never reach the DB/SMTP; both get
+    # the same generic response
+    if email is None or email_rate_limited("rl:resend", email):
+        return success_response
+
+    already_verified_response = Response(
+        {
+            "success": True,
+            "message": "This email is already verified. You can log in.",
+        }
+    )
+
     try:
-        user = User.objects.get(email=email)
+        user = User.objects.only("id").get(email=email)
     except User.DoesNotExist:
         # Don't reveal that user doesn't exist
         logger.info(f"Resend verification requested for non-existent email: {email}")
         return success_response
 
-    # Check email verification status
-    email_address = EmailAddress.objects.filter(user=user, email=email).first()
-
-    if not email_address:
-        # Create EmailAddress if it doesn't exist
-        email_address = EmailAddress.objects.create(
-            user=user, email=email, verified=False, primary=True
-        )
+    # Check email verification status (created if it doesn't exist)
+    email_address, _ = EmailAddress.objects.only(
+        "user", "email", "verified"
+    ).get_or_create(
+        user=user,
+        email=email,
+        defaults={"verified": False, "primary": True},
+    )
 
     if email_address.verified:
         logger.info(
             f"Resend verification requested for already verified email: {email}"
         )
-        return Response(
-            {
-                "success": True,
-                "message": "This email is already verified. You can log in.",
-            }
-        )
+        return already_verified_response
 
-    # Resend verification email using allauth
-    email_address.send_confirmation(request)
+    # Resend verification email using allauth (queued when Celery is configured)
+    queue_email_confirmation(email_address, request)
     logger.info(f"Verification email resent to: {email}")
 
     return success_response
@@ -739,11 +870,13 @@ def password_reset_request_api(request):
     """
     # from allauth.account.forms import ResetPasswordForm
 
-    email = request.data.get("email", "").strip().lower()
+    raw_email = request.data.get("email", "")
 
-    if not email:
+    if not str(raw_email).strip():
         return Response({"success": False, "error": "Email is required"}, status=400)
 
+    email = _canon_email(raw_email)
+
     # Generic success message (no user enumeration)
     success_response = Response(
         {
@@ -752,9 +885,12 @@ def password_reset_request_api(request):
         }
     )
 
-    # Use Custom FrontendResetPasswordForm instead of allauth ResetPasswordForm
-    from apps.accounts.forms import FrontendResetPasswordForm
+    # Malformed input and abusive traffic never reach the DB/SMTP; both get
+    # the same generic response
+    if email is None or email_rate_limited("rl:pwreset", email):
+        return success_response
 
+    # Use Custom FrontendResetPasswordForm instead of allauth ResetPasswordForm
     form = FrontendResetPasswordForm(data={"email": email})
 
     if form.is_valid():
@@ -822,16 +958,6 @@ def password_reset_confirm_api(request):
     - Invalidates existing sessions for security
     - Includes timing attack mitigation
     """
-    # NEW IMPORTS for security enhancements
-    import time
-    from django.utils.http import urlsafe_base64_decode
-    from django.contrib.auth.tokens import default_token_generator
-    from django.contrib.auth.password_validation import validate_password
-    from django.core.exceptions import ValidationError
-    from django.contrib.auth import (
-        update_session_auth_hash,
-    )  # NEW: Session invalidation
-
     # NEW: Consistent delay for timing attack mitigation (applied on failures)
     FAILURE_DELAY_SECONDS = 0.5
 
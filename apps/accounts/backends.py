@@ -1,11 +1,31 @@
 # apps/accounts/backends.py
 from django.contrib.auth.backends import ModelBackend
 from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import check_password, make_password
 from allauth.account.models import EmailAddress
+from allauth.account.auth_backends import AuthenticationBackend
 
 User = get_user_model()
 
-class EmailBackend(ModelBackend):
+# Hash checked for unknown emails in EmailBackend.authenticate(); made once
+# with the default hasher so it has the same cost as a real user's hash
+_DUMMY_PASSWORD_HASH = make_password("!invalid!")
+
+
+class SelectRelatedProfileMixin:
+    """
+    Load session users together with their profile in a single query.
+
+    get_user() is what AuthenticationMiddleware uses to resolve request.user,
+    so joining the profile here lets downstream code read ``request.user.profile``
+    without an extra SELECT.
+    """
+    def get_user(self, user_id):
+        user = User._default_manager.select_related('profile').filter(pk=user_id).first()
+        return user if user is not None and self.user_can_authenticate(user) else None
+
+
+class EmailBackend(SelectRelatedProfileMixin, ModelBackend):
     """
     Authenticate using email instead of username.
     Checks if email is verified via allauth.
@@ -16,13 +36,20 @@ class EmailBackend(ModelBackend):
         
         if not email or not password:
             return None
+        # Emails are stored lowercase, so the unique index serves this lookup
+        email = email.lower()
         
         try:
             # Find user by email
-            user = User.objects.get(email=email)
+            # Skip columns no login path reads; the returned user feeds
+            # issue_tokens/user_payload, so a strict only() would just
+            # trigger one refetch per deferred field
+            user = User.objects.defer('date_joined', 'google_id', 'linkedin_id').get(email=email)
         except User.DoesNotExist:
-            # Run default password hasher to mitigate timing attacks
-            User().set_password(password)
+            # Mitigate timing attacks: verify against a fixed hash so unknown
+            # emails cost the same single hash check as a wrong password
+            # (no salt generation or new hash per request)
+            check_password(password, _DUMMY_PASSWORD_HASH)
             return None
         
         # Check password
@@ -30,9 +57,16 @@ class EmailBackend(ModelBackend):
             return user
         
         return None
-    
-    def get_user(self, user_id):
-        try:
-            return User.objects.get(pk=user_id)
-        except User.DoesNotExist:
-            return None
\ No newline at end of file
+
+
+class ProfileAuthenticationBackend(SelectRelatedProfileMixin, AuthenticationBackend):
+    """
+    allauth backend whose session user lookup also joins the profile.
+    Used for OAuth logins (allauth picks the first AuthenticationBackend).
+
+    It only supplies get_user(): credentials are still checked by the
+    allauth AuthenticationBackend listed after it, so a failed login does
+    not pay for a second lookup and password hash here.
+    """
+    def authenticate(self, request, **credentials):
+        return None
@@ -0,0 +1,95 @@
+# apps/accounts/cache.py
+"""
+Short-lived caches for the accounts app.
+
+Verified login emails: login_api checks the allauth EmailAddress table on
+every login. Verified, active addresses rarely change, so their owner's id
+is cached by email. Entries are dropped whenever the address or its user
+is saved or deleted (see signals.py), and login_api checks the cached id
+against the user that authenticated.
+
+Email confirmation misses: verify_email_api falls back to a database
+lookup when a key is not a valid HMAC key. Keys that match nothing are
+remembered briefly so repeated bogus keys skip that query.
+
+Social apps: allauth looks up the SocialApp (joined with its sites) on
+every OAuth request. Those rows change rarely, so lookups are cached and
+all of them are dropped when any SocialApp changes (see signals.py).
+"""
+import hashlib
+import uuid
+
+from django.core.cache import cache
+
+VERIFIED_EMAIL_CACHE_TIMEOUT = 300  # 5 minutes
+
+
+def verified_email_cache_key(email):
+    """Cache key for a login email."""
+    return f"emailverified:{email.lower()}"
+
+
+def cache_verified_email(email, user_id):
+    """Remember that ``email`` is verified and belongs to active ``user_id``."""
+    cache.set(
+        verified_email_cache_key(email),
+        {"user_id": user_id},
+        VERIFIED_EMAIL_CACHE_TIMEOUT,
+    )
+
+
+def get_verified_email(email):
+    """
+    Return ``{"user_id": ...}`` for a verified email of an active user, or
+    None when the caller has to check the database itself.
+
+    Misses are not loaded here: login_api's own EmailAddress query answers
+    them and refills the entry, so a miss costs a single query.
+    """
+    return cache.get(verified_email_cache_key(email))
+
+
+def invalidate_verified_email(email):
+    """Drop the cached entry for a login email."""
+    cache.delete(verified_email_cache_key(email))
+
+
+CONFIRMATION_MISS_CACHE_TIMEOUT = 300  # 5 minutes
+
+
+def confirmation_miss_cache_key(key):
+    """Cache key for an email confirmation key (hashed to bound its length)."""
+    return f"emailconfirm:miss:{hashlib.sha256(key.encode()).hexdigest()[:32]}"
+
+
+def is_confirmation_miss(key):
+    """True if ``key`` recently matched no email confirmation."""
+    return cache.get(confirmation_miss_cache_key(key)) is not None
+
+
+def cache_confirmation_miss(key):
+    """Remember that ``key`` matched no email confirmation."""
+    cache.set(confirmation_miss_cache_key(key), 1, CONFIRMATION_MISS_CACHE_TIMEOUT)
+
+
+SOCIAL_APPS_CACHE_TIMEOUT = 3600  # 1 hour
+_SOCIAL_APPS_VERSION_KEY = "socialapps:version"
+
+
+def get_social_apps(site_id, provider, client_id, load):
+    """
+    Return the cached SocialApp list for a lookup, calling ``load`` on a miss.
+
+    Keys include a version that invalidate_social_apps() drops, so every
+    cached lookup goes stale at once without tracking individual keys.
+    """
+    version = cache.get_or_set(
+        _SOCIAL_APPS_VERSION_KEY, lambda: uuid.uuid4().hex, None
+    )
+    key = f"socialapps:{version}:{site_id}:{provider}:{client_id}"
+    return cache.get_or_set(key, load, SOCIAL_APPS_CACHE_TIMEOUT)
+
+
+def invalidate_social_apps():
+    """Drop every cached SocialApp lookup."""
+    cache.delete(_SOCIAL_APPS_VERSION_KEY)
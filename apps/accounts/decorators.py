@@ -4,12 +4,66 @@ Custom decorators for authentication rate limiting and security.
 """
 
 import logging
+import time
 from functools import wraps
 from django.http import JsonResponse
 from django.core.cache import cache
 
 logger = logging.getLogger(__name__)
 
+def get_client_ip(request):
+    """
+    Return the client IP (first X-Forwarded-For hop, else REMOTE_ADDR).
+
+    Parsed once per request and kept on the request, so stacked decorators
+    (rate_limit + log_auth_attempt) share it.
+    """
+    ip = getattr(request, '_client_ip', None)
+    if ip is None:
+        x_forwarded_for = request.META.get('HTTP_X_FORWARDED_FOR')
+        if x_forwarded_for:
+            ip = x_forwarded_for.split(',', 1)[0].strip()
+        else:
+            ip = request.META.get('REMOTE_ADDR', 'unknown')
+        request._client_ip = ip
+    return ip
+
+
+def _hit_counter(cache_key, period):
+    """
+    Count one hit on a fixed-window counter and return the new count.
+
+    incr() is a single atomic INCR on Redis/Memcached, so concurrent requests
+    cannot under-count, and the TTL is only set when the window starts.
+    """
+    try:
+        return cache.incr(cache_key)
+    except ValueError:
+        # No window yet; add() loses to a concurrent request that created it
+        if cache.add(cache_key, 1, period):
+            return 1
+        return cache.incr(cache_key)
+
+
+def _sliding_window_count(cache_key, period):
+    """
+    Count one hit and return the estimated number of hits in the last
+    ``period`` seconds (sliding window counter).
+
+    Hits are counted per fixed window; the previous window's count is
+    weighted by how much of it still overlaps the sliding window. This
+    removes the 2x burst a plain fixed window allows at its boundary, with
+    one atomic incr() plus one get() on any cache backend.
+    """
+    now = time.time()
+    window = int(now // period)
+    # Keep each window's counter alive through the next window
+    current = _hit_counter(f"{cache_key}:{window}", period * 2)
+    previous = cache.get(f"{cache_key}:{window - 1}", 0)
+    overlap = 1 - (now % period) / period
+    return current + previous * overlap
+
+
 def rate_limit(key_prefix, limit=5, period=60):
     """
     Rate limiting decorator for authentication endpoints.
@@ -22,33 +76,44 @@ def rate_limit(key_prefix, limit=5, period=60):
     def decorator(view_func):
         @wraps(view_func)
         def wrapper(request, *args, **kwargs):
-            # Get client IP
-            x_forwarded_for = request.META.get('HTTP_X_FORWARDED_FOR')
-            if x_forwarded_for:
-                ip = x_forwarded_for.split(',')[0].strip()
-            else:
-                ip = request.META.get('REMOTE_ADDR', 'unknown')
-            
+            ip = get_client_ip(request)
             cache_key = f"{key_prefix}:{ip}"
             
-            # Get current count
-            current_count = cache.get(cache_key, 0)
-            
-            if current_count >= limit:
-                logger.warning(f"Rate limit exceeded for {ip} on {key_prefix}")
+            if _sliding_window_count(cache_key, period) > limit:
+                logger.warning("Rate limit exceeded for %s on %s", ip, key_prefix)
                 return JsonResponse({
                     "error": "Too many requests. Please try again later.",
                     "retry_after": period
                 }, status=429)
             
-            # Increment count
-            cache.set(cache_key, current_count + 1, period)
-            
             return view_func(request, *args, **kwargs)
         return wrapper
     return decorator
 
 
+def email_rate_limited(key_prefix, email, limit=3, period=3600):
+    """
+    Count a request for ``email`` and report whether it is over the limit.
+
+    Meant for endpoints that send mail to an address (password reset,
+    verification resend): callers return their usual generic response when
+    this is True, so abusive traffic never reaches the DB or SMTP and the
+    response does not reveal anything about the address.
+
+    Args:
+        key_prefix: Prefix for the cache key
+        email: Normalized email address being targeted
+        limit: Maximum number of requests allowed
+        period: Time period in seconds
+    """
+    cache_key = f"{key_prefix}:{email}"
+
+    if _sliding_window_count(cache_key, period) > limit:
+        logger.warning("Rate limit exceeded for %s on %s", email, key_prefix)
+        return True
+    return False
+
+
 def log_auth_attempt(view_func):
     """
     Decorator to log authentication attempts.
@@ -56,12 +121,7 @@ def log_auth_attempt(view_func):
     @wraps(view_func)
     def wrapper(request, *args, **kwargs):
         # Get client info
-        x_forwarded_for = request.META.get('HTTP_X_FORWARDED_FOR')
-        if x_forwarded_for:
-            ip = x_forwarded_for.split(',')[0].strip()
-        else:
-            ip = request.META.get('REMOTE_ADDR', 'unknown')
-        
+        ip = get_client_ip(request)
         user_agent = request.META.get('HTTP_USER_AGENT', 'unknown')
         
         logger.info(f"Auth attempt from IP: {ip}, User-Agent: {user_agent[:100]}")
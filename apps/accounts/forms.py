@@ -2,12 +2,7 @@
 from allauth.account.forms import SignupForm, ResetPasswordForm
 from django import forms
 from django.contrib.auth import get_user_model
-from allauth.account.adapter import get_adapter
-from allauth.account.utils import filter_users_by_email
-from django.conf import settings
-from django.contrib.auth.tokens import default_token_generator
-from django.utils.encoding import force_bytes
-from django.utils.http import urlsafe_base64_encode
+from .tasks import queue_password_reset_email
 
 User = get_user_model()
 
@@ -33,9 +28,9 @@ class CustomSignupForm(SignupForm):
         self.order_fields(field_order)
 
     def clean_username(self):
-        """Validate username uniqueness."""
+        """Validate username uniqueness (case-insensitive, index-backed)."""
         username = self.cleaned_data.get("username")
-        if username and User.objects.filter(username=username).exists():
+        if username and User.objects.filter(username__iexact=username).exists():
             raise forms.ValidationError("A user with that username already exists.")
         return username
 
@@ -53,33 +48,18 @@ class FrontendResetPasswordForm(ResetPasswordForm):
         Override save to force the usage of FRONTEND_URL
         """
         email = self.cleaned_data["email"]
-        users = filter_users_by_email(email)
+        # clean_email() already loaded the matching users (EmailAddress rows
+        # joined to their user, active only, verified addresses preferred);
+        # reuse them instead of querying again
+        users = self.users
 
         if not users:
             return email
 
-        adapter = get_adapter(request)
-        frontend_url = getattr(
-            settings, "FRONTEND_URL", "http://localhost:3000"
-        ).rstrip("/")
-
         for user in users:
-            # 1. Generate the link manually
-            uid = urlsafe_base64_encode(force_bytes(user.pk))
-            token = default_token_generator.make_token(user)
-            password_reset_url = (
-                f"{frontend_url}/reset-password?uid={uid}&token={token}"
-            )
-
-            # 2. Create the context expected by the email template
-            context = {
-                "user": user,
-                "password_reset_url": password_reset_url,
-                "request": request,
-            }
-
-            # 3. Send the mail using the adapter, but passing our custom context
-            # Note: This template name is the default allauth template
-            adapter.send_mail("account/email/password_reset_key", email, context)
+            # The frontend reset link (uid + token) is built and mailed (by a
+            # Celery worker when configured) using the default allauth template
+            # (account/email/password_reset_key)
+            queue_password_reset_email(request, user, email)
 
         return email
@@ -3,9 +3,17 @@ from django.http import JsonResponse
 from allauth.socialaccount.providers.linkedin_oauth2.views import LinkedInOAuth2Adapter
 from allauth.socialaccount.providers.oauth2.client import OAuth2Client
 import requests
+from requests.adapters import HTTPAdapter
 
 logger = logging.getLogger(__name__)
 
+# Shared session so repeated token exchanges reuse the HTTPS connection to
+# linkedin.com instead of a new TCP + TLS handshake per call
+_linkedin_session = requests.Session()
+_linkedin_session.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=16))
+
+LINKEDIN_TIMEOUT = 5  # seconds
+
 def test_linkedin_token_exchange(request):
     """Manually test LinkedIn token exchange"""
     code = request.GET.get('code')
@@ -14,13 +22,11 @@ def test_linkedin_token_exchange(request):
     if not code:
         return JsonResponse({'error': 'No code provided'})
     
-    # Get LinkedIn app credentials
-    from allauth.socialaccount.models import SocialApp
-    from django.contrib.sites.shortcuts import get_current_site
+    # Get LinkedIn app credentials (cached by the social account adapter)
+    from allauth.socialaccount.adapter import get_adapter
     
     try:
-        site = get_current_site(request)
-        app = SocialApp.objects.get(provider='linkedin_oauth2', sites=site)
+        app = get_adapter(request).get_app(request, 'linkedin_oauth2')
         
         # Manually try to exchange code for token
         token_url = 'https://www.linkedin.com/oauth/v2/accessToken'
@@ -36,7 +42,7 @@ def test_linkedin_token_exchange(request):
         
         logger.info(f"Attempting token exchange with callback URL: {callback_url}")
         
-        response = requests.post(token_url, data=data)
+        response = _linkedin_session.post(token_url, data=data, timeout=LINKEDIN_TIMEOUT)
         
         return JsonResponse({
             'status': 'Token exchange attempt',
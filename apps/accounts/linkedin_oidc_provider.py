@@ -2,11 +2,23 @@
 from allauth.socialaccount.providers.linkedin_oauth2.provider import LinkedInOAuth2Provider
 from allauth.socialaccount.providers.linkedin_oauth2.views import LinkedInOAuth2Adapter
 from allauth.socialaccount.providers.oauth2.views import OAuth2LoginView, OAuth2CallbackView
-import jwt
+import base64
+import json
 import logging
+import re
 
 logger = logging.getLogger(__name__)
 
+# Session keys cleared before a LinkedIn login (matched case-insensitively)
+_OAUTH_SESSION_KEY_RE = re.compile(r'linkedin|oauth', re.IGNORECASE)
+
+def _decode_id_token_payload(id_token):
+    """Return the claims of an unverified JWT (header.payload.signature)."""
+    _, payload_b64, _ = id_token.split('.')
+    payload_b64 += '=' * (-len(payload_b64) % 4)
+    return json.loads(base64.urlsafe_b64decode(payload_b64))
+
+
 class CustomLinkedInOAuth2Adapter(LinkedInOAuth2Adapter):
     """Custom adapter that extracts user info from ID token and forces re-authentication"""
     
@@ -30,9 +42,10 @@ class CustomLinkedInOAuth2Adapter(LinkedInOAuth2Adapter):
             id_token = response.get('id_token')
             
             if id_token:
-                # Decode the JWT without verification (we trust LinkedIn's token)
-                decoded = jwt.decode(id_token, options={"verify_signature": False})
-                logger.info(f"Decoded ID token: {decoded}")
+                # Read the JWT claims without verification (we trust LinkedIn's
+                # token), so only the payload segment needs decoding
+                decoded = _decode_id_token_payload(id_token)
+                logger.info("Decoded ID token: %s", decoded)
                 
                 # Create extra_data from the decoded token
                 extra_data = {
@@ -68,9 +81,10 @@ class CustomLinkedInOAuth2LoginView(OAuth2LoginView):
     def dispatch(self, request, *args, **kwargs):
         """Override to ensure session is clean before OAuth"""
         # Clear any existing LinkedIn-related session data
-        linkedin_session_keys = [key for key in request.session.keys() if 'linkedin' in key.lower() or 'oauth' in key.lower()]
-        for key in linkedin_session_keys:
-            del request.session[key]
+        # One regex scan per key instead of lowercasing each key twice
+        session = request.session
+        for key in [key for key in session.keys() if _OAUTH_SESSION_KEY_RE.search(key)]:
+            session.pop(key)
         
         logger.info("Cleared LinkedIn session data before OAuth initiation")
         return super().dispatch(request, *args, **kwargs)
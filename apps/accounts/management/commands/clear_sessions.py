@@ -1,12 +1,22 @@
 from django.core.management.base import BaseCommand
 from django.contrib.sessions.models import Session
 
+# Rows removed per DELETE; keeps each statement's transaction and locks small
+BATCH_SIZE = 10000
+
 class Command(BaseCommand):
     help = 'Clear all user sessions'
 
     def handle(self, *args, **options):
-        count = Session.objects.all().count()
-        Session.objects.all().delete()
+        # Delete in bounded batches (DELETE ... WHERE pk IN (SELECT ... LIMIT n))
+        # so a large django_session table is never loaded or locked at once
+        count = 0
+        while True:
+            batch = Session.objects.values_list('pk', flat=True)[:BATCH_SIZE]
+            deleted, _ = Session.objects.filter(pk__in=batch).delete()
+            if not deleted:
+                break
+            count += deleted
         self.stdout.write(
             self.style.SUCCESS(f'Successfully deleted {count} sessions')
-        )
\ No newline at end of file
+        )
@@ -2,7 +2,15 @@ from django.core.management.base import BaseCommand
 from django.contrib.sites.models import Site
 from allauth.socialaccount.models import SocialApp
 from django.conf import settings
+from apps.accounts.cache import invalidate_social_apps
 import environ
+import hmac
+
+# (provider, display name, client id env var, client secret env var)
+PROVIDERS = (
+    ('google', 'Google', 'GOOGLE_OAUTH_CLIENT_ID', 'GOOGLE_OAUTH_CLIENT_SECRET'),
+    ('linkedin_oauth2', 'LinkedIn', 'LINKEDIN_OAUTH_CLIENT_ID', 'LINKEDIN_OAUTH_CLIENT_SECRET'),
+)
 
 class Command(BaseCommand):
     help = 'Create SocialApp instances for Google and LinkedIn OAuth'
@@ -22,62 +30,42 @@ class Command(BaseCommand):
                 name='localhost'
             )
 
-        # Create Google SocialApp
-        google_client_id = env('GOOGLE_OAUTH_CLIENT_ID')
-        google_client_secret = env('GOOGLE_OAUTH_CLIENT_SECRET')
+        # Apps whose credentials changed, written together at the end
+        dirty = []
 
-        if google_client_id and google_client_secret:
-            google_app, created = SocialApp.objects.get_or_create(
-                provider='google',
-                defaults={
-                    'name': 'Google OAuth',
-                    'client_id': google_client_id,
-                    'secret': google_client_secret,
-                }
-            )
-            if created:
-                google_app.sites.add(site)
-                self.stdout.write(self.style.SUCCESS('Created Google SocialApp'))
-            else:
-                # Update credentials if changed
-                if google_app.client_id != google_client_id or google_app.secret != google_client_secret:
-                    google_app.client_id = google_client_id
-                    google_app.secret = google_client_secret
-                    google_app.save()
-                    self.stdout.write(self.style.SUCCESS('Updated Google SocialApp credentials'))
-                if not google_app.sites.filter(id=site.id).exists():
-                    google_app.sites.add(site)
-                    self.stdout.write(self.style.SUCCESS('Added site to Google SocialApp'))
-        else:
-            self.stdout.write(self.style.WARNING('Google OAuth credentials not found in .env'))
+        for provider, label, client_id_var, secret_var in PROVIDERS:
+            client_id = env(client_id_var)
+            client_secret = env(secret_var)
 
-        # Create LinkedIn SocialApp
-        linkedin_client_id = env('LINKEDIN_OAUTH_CLIENT_ID')
-        linkedin_client_secret = env('LINKEDIN_OAUTH_CLIENT_SECRET')
+            if not (client_id and client_secret):
+                self.stdout.write(self.style.WARNING(f'{label} OAuth credentials not found in .env'))
+                continue
 
-        if linkedin_client_id and linkedin_client_secret:
-            linkedin_app, created = SocialApp.objects.get_or_create(
-                provider='linkedin_oauth2',
+            app, created = SocialApp.objects.get_or_create(
+                provider=provider,
                 defaults={
-                    'name': 'LinkedIn OAuth',
-                    'client_id': linkedin_client_id,
-                    'secret': linkedin_client_secret,
+                    'name': f'{label} OAuth',
+                    'client_id': client_id,
+                    'secret': client_secret,
                 }
             )
             if created:
-                linkedin_app.sites.add(site)
-                self.stdout.write(self.style.SUCCESS('Created LinkedIn SocialApp'))
-            else:
+                self.stdout.write(self.style.SUCCESS(f'Created {label} SocialApp'))
+            elif app.client_id != client_id or not hmac.compare_digest(
+                app.secret.encode(), client_secret.encode()
+            ):
                 # Update credentials if changed
-                if linkedin_app.client_id != linkedin_client_id or linkedin_app.secret != linkedin_client_secret:
-                    linkedin_app.client_id = linkedin_client_id
-                    linkedin_app.secret = linkedin_client_secret
-                    linkedin_app.save()
-                    self.stdout.write(self.style.SUCCESS('Updated LinkedIn SocialApp credentials'))
-                if not linkedin_app.sites.filter(id=site.id).exists():
-                    linkedin_app.sites.add(site)
-                    self.stdout.write(self.style.SUCCESS('Added site to LinkedIn SocialApp'))
-        else:
-            self.stdout.write(self.style.WARNING('LinkedIn OAuth credentials not found in .env'))
+                app.client_id = client_id
+                app.secret = client_secret
+                dirty.append(app)
+                self.stdout.write(self.style.SUCCESS(f'Updated {label} SocialApp credentials'))
+
+            # add() skips sites that are already linked, so no exists() probe
+            app.sites.add(site)
+
+        if dirty:
+            SocialApp.objects.bulk_update(dirty, ['client_id', 'secret'])
+            # bulk_update sends no post_save, so drop cached lookups here
+            invalidate_social_apps()
 
-        self.stdout.write(self.style.SUCCESS('SocialApp setup completed'))
\ No newline at end of file
+        self.stdout.write(self.style.SUCCESS('SocialApp setup completed'))
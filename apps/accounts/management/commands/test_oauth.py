@@ -10,59 +10,68 @@ class Command(BaseCommand):
     help = 'Test OAuth endpoints'
 
     def handle(self, *args, **options):
+        # Collect the report and write it in one go instead of one write
+        # (and flush) per line; the finally block still prints it on errors
+        lines = []
+        try:
+            self._run_checks(lines.append)
+        finally:
+            self.stdout.write("\n".join(lines))
+
+    def _run_checks(self, out):
         client = Client()
 
-        self.stdout.write("Testing OAuth endpoints...")
-        self.stdout.write("=" * 50)
+        out("Testing OAuth endpoints...")
+        out("=" * 50)
 
         # Test LinkedIn login endpoint
-        self.stdout.write("\n1. Testing LinkedIn login endpoint...")
+        out("\n1. Testing LinkedIn login endpoint...")
         try:
             response = client.get('/api/auth/linkedin/login/')
-            self.stdout.write(f"   Status: {response.status_code}")
+            out(f"   Status: {response.status_code}")
             if response.status_code == 302:
                 location = response['Location']
-                self.stdout.write(f"   Redirect to: {location}")
+                out(f"   Redirect to: {location}")
                 if 'linkedin' in location.lower():
-                    self.stdout.write(self.style.SUCCESS("   ✅ Correctly redirects to LinkedIn"))
+                    out(self.style.SUCCESS("   ✅ Correctly redirects to LinkedIn"))
                 else:
-                    self.stdout.write(self.style.ERROR("   ❌ Redirect doesn't contain 'linkedin'"))
+                    out(self.style.ERROR("   ❌ Redirect doesn't contain 'linkedin'"))
             else:
-                self.stdout.write(self.style.ERROR(f"   ❌ Expected 302, got {response.status_code}"))
+                out(self.style.ERROR(f"   ❌ Expected 302, got {response.status_code}"))
         except Exception as e:
-            self.stdout.write(self.style.ERROR(f"   ❌ Error: {e}"))
+            out(self.style.ERROR(f"   ❌ Error: {e}"))
 
         # Test Google login endpoint
-        self.stdout.write("\n2. Testing Google login endpoint...")
+        out("\n2. Testing Google login endpoint...")
         try:
             response = client.get('/api/auth/google/login/')
-            self.stdout.write(f"   Status: {response.status_code}")
+            out(f"   Status: {response.status_code}")
             if response.status_code == 302:
                 location = response['Location']
-                self.stdout.write(f"   Redirect to: {location}")
+                out(f"   Redirect to: {location}")
                 if 'google' in location.lower():
-                    self.stdout.write(self.style.SUCCESS("   ✅ Correctly redirects to Google"))
+                    out(self.style.SUCCESS("   ✅ Correctly redirects to Google"))
                 else:
-                    self.stdout.write(self.style.ERROR("   ❌ Redirect doesn't contain 'google'"))
+                    out(self.style.ERROR("   ❌ Redirect doesn't contain 'google'"))
             else:
-                self.stdout.write(self.style.ERROR(f"   ❌ Expected 302, got {response.status_code}"))
+                out(self.style.ERROR(f"   ❌ Expected 302, got {response.status_code}"))
         except Exception as e:
-            self.stdout.write(self.style.ERROR(f"   ❌ Error: {e}"))
+            out(self.style.ERROR(f"   ❌ Error: {e}"))
 
         # Test OAuth success endpoint (should redirect when not authenticated)
-        self.stdout.write("\n3. Testing OAuth success endpoint (not authenticated)...")
+        out("\n3. Testing OAuth success endpoint (not authenticated)...")
         try:
             response = client.get('/api/auth/social/success/')
-            self.stdout.write(f"   Status: {response.status_code}")
+            out(f"   Status: {response.status_code}")
             if response.status_code == 302:
-                self.stdout.write(self.style.SUCCESS("   ✅ Correctly redirects when not authenticated"))
+                out(self.style.SUCCESS("   ✅ Correctly redirects when not authenticated"))
             else:
-                self.stdout.write(self.style.ERROR(f"   ❌ Expected 302, got {response.status_code}"))
+                out(self.style.ERROR(f"   ❌ Expected 302, got {response.status_code}"))
         except Exception as e:
-            self.stdout.write(self.style.ERROR(f"   ❌ Error: {e}"))
+            out(self.style.ERROR(f"   ❌ Error: {e}"))
 
         # Test with authenticated user
-        self.stdout.write("\n4. Testing OAuth success endpoint (authenticated)...")
+        out("\n4. Testing OAuth success endpoint (authenticated)...")
         try:
             # Create or get test user
             test_user, created = User.objects.get_or_create(
@@ -74,73 +83,74 @@ class Command(BaseCommand):
             )
 
             if created:
-                UserProfile.objects.get_or_create(
-                    user=test_user,
-                    defaults={'oauth_provider': 'linkedin'}
+                # The profile already exists (post_save signal); set the
+                # provider with a single UPDATE
+                UserProfile.objects.filter(user=test_user).update(
+                    oauth_provider='linkedin'
                 )
-                self.stdout.write(f"   Created test user: {test_user.email}")
+                out(f"   Created test user: {test_user.email}")
 
             # Force login
             client.force_login(test_user)
 
             response = client.get('/api/auth/social/success/')
-            self.stdout.write(f"   Status: {response.status_code}")
+            out(f"   Status: {response.status_code}")
 
             if response.status_code == 200:
                 try:
                     data = json.loads(response.content)
-                    self.stdout.write("   Response data:")
-                    self.stdout.write(f"     Success: {data.get('success')}")
-                    self.stdout.write(f"     Has tokens: {'tokens' in data}")
-                    self.stdout.write(f"     Has user data: {'user' in data}")
+                    out("   Response data:")
+                    out(f"     Success: {data.get('success')}")
+                    out(f"     Has tokens: {'tokens' in data}")
+                    out(f"     Has user data: {'user' in data}")
 
                     if 'user' in data:
                         user_data = data['user']
-                        self.stdout.write(f"     User email: {user_data.get('email')}")
-                        self.stdout.write(f"     OAuth provider: {user_data.get('oauth_provider')}")
+                        out(f"     User email: {user_data.get('email')}")
+                        out(f"     OAuth provider: {user_data.get('oauth_provider')}")
 
                         if user_data.get('email') == "gf316@gmail.com":
-                            self.stdout.write(self.style.SUCCESS("   ✅ Correct user email returned"))
+                            out(self.style.SUCCESS("   ✅ Correct user email returned"))
                         else:
-                            self.stdout.write(self.style.ERROR("   ❌ Wrong user email"))
+                            out(self.style.ERROR("   ❌ Wrong user email"))
 
                         if user_data.get('oauth_provider') == 'linkedin':
-                            self.stdout.write(self.style.SUCCESS("   ✅ Correct OAuth provider"))
+                            out(self.style.SUCCESS("   ✅ Correct OAuth provider"))
                         else:
-                            self.stdout.write(self.style.ERROR("   ❌ Wrong OAuth provider"))
+                            out(self.style.ERROR("   ❌ Wrong OAuth provider"))
 
                 except json.JSONDecodeError:
-                    self.stdout.write(self.style.ERROR("   ❌ Invalid JSON response"))
-                    self.stdout.write(f"   Raw content: {response.content[:200]}")
+                    out(self.style.ERROR("   ❌ Invalid JSON response"))
+                    out(f"   Raw content: {response.content[:200]}")
             else:
-                self.stdout.write(self.style.ERROR(f"   ❌ Expected 200, got {response.status_code}"))
+                out(self.style.ERROR(f"   ❌ Expected 200, got {response.status_code}"))
 
         except Exception as e:
-            self.stdout.write(self.style.ERROR(f"   ❌ Error: {e}"))
+            out(self.style.ERROR(f"   ❌ Error: {e}"))
             import traceback
             self.stderr.write(traceback.format_exc())
 
         # Test user data
-        self.stdout.write("\n5. Checking user data...")
+        out("\n5. Checking user data...")
         try:
-            user = User.objects.filter(email="gf316@gmail.com").first()
+            user = User.objects.select_related('profile').filter(email="gf316@gmail.com").first()
             if user:
-                self.stdout.write(f"   User exists: {user.email}")
-                self.stdout.write(f"   Username: {user.username}")
-                self.stdout.write(f"   LinkedIn ID: {user.linkedin_id}")
+                out(f"   User exists: {user.email}")
+                out(f"   Username: {user.username}")
+                out(f"   LinkedIn ID: {user.linkedin_id}")
 
-                profile = UserProfile.objects.filter(user=user).first()
+                profile = getattr(user, 'profile', None)
                 if profile:
-                    self.stdout.write(f"   Profile OAuth provider: {profile.oauth_provider}")
-                    self.stdout.write(f"   Profile LinkedIn ID: {profile.linkedin_id}")
-                    self.stdout.write(self.style.SUCCESS("   ✅ User profile complete"))
+                    out(f"   Profile OAuth provider: {profile.oauth_provider}")
+                    out(f"   Profile LinkedIn ID: {profile.linkedin_id}")
+                    out(self.style.SUCCESS("   ✅ User profile complete"))
                 else:
-                    self.stdout.write(self.style.ERROR("   ❌ No user profile found"))
+                    out(self.style.ERROR("   ❌ No user profile found"))
             else:
-                self.stdout.write(self.style.ERROR("   ❌ No user found with email gf316@gmail.com"))
+                out(self.style.ERROR("   ❌ No user found with email gf316@gmail.com"))
 
         except Exception as e:
-            self.stdout.write(self.style.ERROR(f"   ❌ Error checking user: {e}"))
+            out(self.style.ERROR(f"   ❌ Error checking user: {e}"))
 
-        self.stdout.write("\n" + "=" * 50)
-        self.stdout.write("OAuth test completed!")
\ No newline at end of file
+        out("\n" + "=" * 50)
+        out("OAuth test completed!")
\ No newline at end of file
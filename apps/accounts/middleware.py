@@ -1,23 +1,30 @@
 # apps/accounts/middleware.py
 
+import json
 import logging
 from django.shortcuts import redirect
-from django.http import JsonResponse
+from django.http import HttpResponse, JsonResponse
 from django.conf import settings
 from django.utils.deprecation import MiddlewareMixin
+from apps.profiles.cache import get_payload_version
 from apps.profiles.models import UserProfile
 from django.db import DatabaseError
-import environ
-from pathlib import Path
+from django.db.models import prefetch_related_objects
 
-BASE_DIR = Path(__file__).resolve().parent.parent
-
-env = environ.Env()
-environ.Env.read_env(BASE_DIR / ".env")
+logger = logging.getLogger(__name__)
 
-FRONTEND_URL = env("FRONTEND_URL")
+# Frontend pages users are sent to when a check fails
+SELECT_ROLE_URL = f"{settings.FRONTEND_URL}/select-role/"
+ONBOARDING_URL = f"{settings.FRONTEND_URL}/onboarding/"
 
-logger = logging.getLogger(__name__)
+# Static JSON body for the redirect-loop error, serialized once at import
+_REDIRECT_LOOP_JSON = json.dumps(
+    {
+        "error": "Redirect loop detected. Please contact support.",
+        "redirect_url": SELECT_ROLE_URL,
+        "status": "error",
+    }
+).encode()
 
 
 class RoleRequiredMiddleware(MiddlewareMixin):
@@ -52,80 +59,119 @@ class RoleRequiredMiddleware(MiddlewareMixin):
     )
 
     # Root URL should not be redirected by middleware - it handles its own logic
-    EXEMPT_PATHS = (
+    EXEMPT_PATHS = frozenset((
         "/",
         "/api/",  # API root endpoint
-    )
+    ))
+
+    # Paths that get a JSON 403 instead of a redirect when a check fails
+    JSON_RESPONSE_PREFIXES = ("/api/", "/dashboard/")
 
     MAX_REDIRECTS = 3
     REDIRECT_COUNT_KEY = "role_redirect_count"
+    # [profile_id, payload_version] recorded once role and onboarding checks pass
+    GATES_PASSED_KEY = "role_gates_passed"
+
+    @staticmethod
+    def _load_profile(user):
+        """
+        Load the profile with everything the role/onboarding checks read.
+
+        Session users already carry their profile (joined by
+        SelectRelatedProfileMixin.get_user), so only its roles are
+        prefetched. Otherwise the profile is loaded with its roles prefetched
+        and the role-specific profiles joined, and cached on the user for
+        views later in the request. Either way the checks run off at most one
+        profile query plus one roles query.
+        Returns None if the user has no profile yet.
+        """
+        if type(user).profile.is_cached(user):
+            # A missing profile is cached as None; the reverse accessor then
+            # raises RelatedObjectDoesNotExist (an AttributeError)
+            profile = getattr(user, "profile", None)
+            if profile is not None:
+                prefetch_related_objects([profile], "roles")
+            return profile
+        try:
+            profile = (
+                UserProfile.objects.select_related("interviewer_profile", "interviewee_profile")
+                .prefetch_related("roles")
+                .get(user=user)
+            )
+        except UserProfile.DoesNotExist:
+            return None
+        user.profile = profile
+        return profile
 
     def process_request(self, request):
         path = request.path_info
-        logger.debug(f"[RoleMiddleware] Checking path: {path}")
+        logger.debug("[RoleMiddleware] Checking path: %s", path)
 
         # Allow exempt paths (exact match first for efficiency)
         if path in self.EXEMPT_PATHS:
-            logger.debug(f"[RoleMiddleware] Path is exempt (exact): {path}")
+            logger.debug("[RoleMiddleware] Path is exempt (exact): %s", path)
             return None
 
-        # Allow exempt prefixes
-        for exempt_prefix in self.EXEMPT_PREFIXES:
-            if path.startswith(exempt_prefix):
-                logger.debug(f"[RoleMiddleware] Path is exempt (prefix): {path}")
-                return None
+        # Allow exempt prefixes (str.startswith checks the whole tuple in one call)
+        if path.startswith(self.EXEMPT_PREFIXES):
+            logger.debug("[RoleMiddleware] Path is exempt (prefix): %s", path)
+            return None
 
         user = getattr(request, "user", None)
         if not user or not user.is_authenticated:
-            logger.debug(f"[RoleMiddleware] User not authenticated, skipping: {path}")
+            logger.debug("[RoleMiddleware] User not authenticated, skipping: %s", path)
             return None
 
         # ========== ADMIN BYPASS (NEW) ==========
         # Admins (is_staff or is_superuser) bypass role and onboarding checks
         if user.is_staff or user.is_superuser:
-            logger.debug(f"[RoleMiddleware] Admin user {user.email} bypassing checks for: {path}")
+            logger.debug(
+                "[RoleMiddleware] Admin user %s bypassing checks for: %s", user.email, path
+            )
+            return None
+
+        # Checks already passed and the profile has not changed since
+        gates_passed = request.session.get(self.GATES_PASSED_KEY)
+        if gates_passed and gates_passed[1] == get_payload_version(gates_passed[0]):
             return None
 
         # Check redirect loop prevention
         redirect_count = request.session.get(self.REDIRECT_COUNT_KEY, 0)
+        new_count = redirect_count + 1  # stored only if a check below fails
         if redirect_count >= self.MAX_REDIRECTS:
             logger.error(
-                f"[RoleMiddleware] Redirect loop detected for user {user.email}"
+                "[RoleMiddleware] Redirect loop detected for user %s", user.email
             )
             request.session[self.REDIRECT_COUNT_KEY] = 0
 
-            # Get frontend URL from settings with fallback
-            frontend_url = getattr(settings, "FRONTEND_URL", FRONTEND_URL)
-
-            return JsonResponse(
-                {
-                    "error": "Redirect loop detected. Please contact support.",
-                    "redirect_url": f"{frontend_url}/select-role/",
-                    "status": "error",
-                },
-                status=400,
+            return HttpResponse(
+                _REDIRECT_LOOP_JSON, content_type="application/json", status=400
             )
 
         try:
-            profile = UserProfile.objects.filter(user=user).first()
+            profile = self._load_profile(user)
             if profile is None:
                 profile = UserProfile.objects.create(user=user)
                 logger.info(
-                    f"[RoleMiddleware] Created missing profile for user {user.email}"
+                    "[RoleMiddleware] Created missing profile for user %s", user.email
                 )
+            # Read before the checks so a change made meanwhile invalidates the result
+            payload_version = get_payload_version(profile.pk)
 
             # ========== STEP 1: Check for role selection ==========
             # This supports multi-role: user is allowed if they have any role assigned
             if not profile.has_any_role():
-                request.session[self.REDIRECT_COUNT_KEY] = redirect_count + 1
+                request.session[self.REDIRECT_COUNT_KEY] = new_count
                 logger.info(
-                    f"[RoleMiddleware] User {user.email} needs role selection (count: {redirect_count + 1})"
+                    "[RoleMiddleware] User %s needs role selection (count: %s)",
+                    user.email,
+                    new_count,
                 )
 
                 # For API endpoints, return JSON instead of redirect
-                if path.startswith("/api/") or path.startswith("/dashboard/"):
+                if path.startswith(self.JSON_RESPONSE_PREFIXES):
                     logger.info(
-                        f"[RoleMiddleware] Returning 403 Role Required for API: {path}"
+                        "[RoleMiddleware] Returning 403 Role Required for API: %s", path
                     )
                     return JsonResponse(
                         {
@@ -138,28 +184,28 @@ class RoleRequiredMiddleware(MiddlewareMixin):
                     )
                 else:
                     # For web requests, redirect to frontend select-role page
-                    frontend_url = getattr(settings, "FRONTEND_URL", FRONTEND_URL)
-                    redirect_url = f"{frontend_url}/select-role/"
                     logger.info(
-                        f"[RoleMiddleware] Redirecting web user to: {redirect_url}"
+                        "[RoleMiddleware] Redirecting web user to: %s", SELECT_ROLE_URL
                     )
-                    return redirect(redirect_url)
+                    return redirect(SELECT_ROLE_URL)
 
             # ========== STEP 2: Check for onboarding completion (NEW) ==========
             # Onboarding is required AFTER role selection
             if profile.is_onboarding_required():
-                request.session[self.REDIRECT_COUNT_KEY] = redirect_count + 1
+                request.session[self.REDIRECT_COUNT_KEY] = new_count
                 logger.info(
-                    f"[RoleMiddleware] User {user.email} needs onboarding completion (count: {redirect_count + 1})"
+                    "[RoleMiddleware] User %s needs onboarding completion (count: %s)",
+                    user.email,
+                    new_count,
                 )
                 
                 # Get onboarding status for response
                 onboarding_status = profile.get_onboarding_status()
                 
                 # For API endpoints, return JSON instead of redirect
-                if path.startswith("/api/") or path.startswith("/dashboard/"):
+                if path.startswith(self.JSON_RESPONSE_PREFIXES):
                     logger.info(
-                        f"[RoleMiddleware] Returning 403 Onboarding Required for API: {path}"
+                        "[RoleMiddleware] Returning 403 Onboarding Required for API: %s", path
                     )
                     return JsonResponse(
                         {
@@ -173,32 +219,37 @@ class RoleRequiredMiddleware(MiddlewareMixin):
                     )
                 else:
                     # For web requests, redirect to frontend onboarding page
-                    frontend_url = getattr(settings, "FRONTEND_URL", FRONTEND_URL)
-                    redirect_url = f"{frontend_url}/onboarding/"
                     logger.info(
-                        f"[RoleMiddleware] Redirecting web user to onboarding: {redirect_url}"
+                        "[RoleMiddleware] Redirecting web user to onboarding: %s", ONBOARDING_URL
                     )
-                    return redirect(redirect_url)
+                    return redirect(ONBOARDING_URL)
 
             # Reset redirect count on successful checks
             if redirect_count > 0:
                 logger.debug(
-                    f"[RoleMiddleware] Resetting redirect count for {user.email}"
+                    "[RoleMiddleware] Resetting redirect count for %s", user.email
                 )
                 request.session[self.REDIRECT_COUNT_KEY] = 0
+            gates = [profile.pk, payload_version]
+            if gates_passed != gates:
+                request.session[self.GATES_PASSED_KEY] = gates
 
             # UPDATED: Log all user roles instead of single role
-            user_roles = profile.get_role_names()
-            logger.debug(
-                f"[RoleMiddleware] User {user.email} has roles {user_roles}, onboarding complete, allowing: {path}"
-            )
+            # (role names are only built when DEBUG records will be emitted)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "[RoleMiddleware] User %s has roles %s, onboarding complete, allowing: %s",
+                    user.email,
+                    profile.get_role_names(),
+                    path,
+                )
 
         except DatabaseError as e:
-            logger.error(f"Database error in RoleRequiredMiddleware: {e}")
+            logger.error("Database error in RoleRequiredMiddleware: %s", e)
             return None
         except Exception as e:
             logger.error(
-                f"Unexpected error in RoleRequiredMiddleware: {e}", exc_info=True
+                "Unexpected error in RoleRequiredMiddleware: %s", e, exc_info=True
             )
             return None
 
@@ -2,19 +2,26 @@
 import logging
 import traceback
 
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+
 logger = logging.getLogger(__name__)
 
 class AllauthDebugMiddleware:
-    """Middleware to catch and log allauth exceptions"""
+    """Middleware to catch and log allauth exceptions (only when ALLAUTH_DEBUG is on)"""
     
     def __init__(self, get_response):
+        if not getattr(settings, "ALLAUTH_DEBUG", False):
+            # Drop the middleware from the chain entirely
+            raise MiddlewareNotUsed
         self.get_response = get_response
     
     def __call__(self, request):
         return self.get_response(request)
     
     def process_exception(self, request, exception):
-        if 'linkedin' in request.path.lower():
+        # LinkedIn OAuth paths are lowercase, so no need to lowercase the path
+        if 'linkedin' in request.path:
             logger.error(f"Exception in LinkedIn OAuth flow: {exception}")
             logger.error(f"Exception type: {type(exception).__name__}")
             logger.error(f"Traceback: {traceback.format_exc()}")
@@ -0,0 +1,31 @@
+# Generated by Django 6.0.1 on 2026-10-17 10:00
+
+from django.db import migrations
+
+
+def lowercase_emails(apps, schema_editor):
+    User = apps.get_model('accounts', 'User')
+
+    # Lowercase stored emails so auth lookups can use plain equality on the
+    # unique index. Rows whose lowercase form is already taken are left as-is
+    # to avoid violating the unique constraint.
+    existing = set(User.objects.values_list('email', flat=True))
+    for user in User.objects.only('id', 'email').iterator():
+        normalized = user.email.lower()
+        if normalized == user.email or normalized in existing:
+            continue
+        existing.discard(user.email)
+        existing.add(normalized)
+        user.email = normalized
+        user.save(update_fields=['email'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0003_alter_user_username'),
+    ]
+
+    operations = [
+        migrations.RunPython(lowercase_emails, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 6.0.1 on 2026-10-17 11:00
+
+import django.db.models.functions.text
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0004_normalize_user_email'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='user',
+            index=models.Index(django.db.models.functions.text.Upper('username'), name='accounts_user_username_upper'),
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 6.0.1 on 2026-10-17 12:00
+
+from django.core.management import call_command
+from django.db import migrations
+
+
+def create_cache_table(apps, schema_editor):
+    # Creates the table for a DatabaseCache backend (CACHES); a no-op for
+    # other backends and when the table already exists
+    call_command('createcachetable', database=schema_editor.connection.alias)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0005_user_username_upper_index'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_cache_table, migrations.RunPython.noop),
+    ]
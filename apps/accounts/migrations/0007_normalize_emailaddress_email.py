@@ -0,0 +1,51 @@
+# Generated by Django 6.0.1 on 2026-10-17 13:00
+
+from django.db import migrations
+from django.db.models.functions import Lower
+
+
+def lowercase_email_addresses(apps, schema_editor):
+    EmailAddress = apps.get_model('account', 'EmailAddress')
+
+    # signup_api used to store allauth EmailAddress rows as typed, while
+    # login now matches them exactly against the lowercased email. Lowercase
+    # them, merging a user's case-only duplicates into one row (verified and
+    # primary if any of the merged rows was).
+    user_ids = (
+        EmailAddress.objects.exclude(email=Lower('email'))
+        .values_list('user_id', flat=True)
+        .distinct()
+    )
+    for user_id in list(user_ids):
+        groups = {}
+        rows = EmailAddress.objects.filter(user_id=user_id).order_by('-verified', '-primary', 'id')
+        for address in rows:
+            groups.setdefault(address.email.lower(), []).append(address)
+
+        for normalized, (keep, *duplicates) in groups.items():
+            verified = keep.verified or any(d.verified for d in duplicates)
+            if verified and EmailAddress.objects.filter(
+                email=normalized, verified=True
+            ).exclude(user_id=user_id).exists():
+                # Another user holds this address verified; leave the rows
+                # as-is rather than violate unique_verified_email
+                continue
+            primary = keep.primary or any(d.primary for d in duplicates)
+            EmailAddress.objects.filter(pk__in=[d.pk for d in duplicates]).delete()
+            if (keep.email, keep.verified, keep.primary) != (normalized, verified, primary):
+                keep.email = normalized
+                keep.verified = verified
+                keep.primary = primary
+                keep.save(update_fields=['email', 'verified', 'primary'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0006_create_cache_table'),
+        ('account', '0009_emailaddress_unique_primary_email'),
+    ]
+
+    operations = [
+        migrations.RunPython(lowercase_email_addresses, migrations.RunPython.noop),
+    ]
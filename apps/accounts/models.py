@@ -1,6 +1,7 @@
 # apps/accounts/models.py
 from django.contrib.auth.models import AbstractUser
 from django.db import models
+from django.db.models.functions import Upper
 
 class User(AbstractUser):
     """
@@ -12,7 +13,9 @@ class User(AbstractUser):
 
     email = models.EmailField(unique=True)
     
-    # Username is required and unique
+    # Username is required and unique. On PostgreSQL, unique CharFields also get
+    # a varchar_pattern_ops "_like" index, which serves the username__startswith
+    # collision lookup in CustomSocialAccountAdapter._ensure_unique_username.
     username = models.CharField(max_length=150, unique=True)
 
     # Optional OAuth identifiers
@@ -22,5 +25,18 @@ class User(AbstractUser):
     USERNAME_FIELD = 'email'
     REQUIRED_FIELDS = ['username']  # Username required when creating superuser
 
+    class Meta(AbstractUser.Meta):
+        indexes = [
+            # Serves case-insensitive username lookups (username__iexact
+            # compiles to UPPER("username") on PostgreSQL)
+            models.Index(Upper("username"), name="accounts_user_username_upper"),
+        ]
+
+    def save(self, *args, **kwargs):
+        # Store emails lowercased so lookups can use plain equality on the unique index
+        if self.email:
+            self.email = self.email.lower()
+        super().save(*args, **kwargs)
+
     def __str__(self):
         return self.email
@@ -18,6 +18,9 @@ class UserPayloadSerializer(serializers.Serializer):
     """
     Serializer for user payload in API responses.
     Updated to support multi-role users.
+
+    Documentation only (swagger schemas): responses are built as plain
+    dicts by api.user_payload(), never run through this serializer.
     """
     username = serializers.CharField()
     email = serializers.EmailField()
@@ -10,21 +10,72 @@ User = settings.AUTH_USER_MODEL
 def create_user_profile(sender, instance, created, **kwargs):
     """
     Create UserProfile only on user creation.
-    Use get_or_create to handle race conditions.
+    A single INSERT ... ON CONFLICT DO NOTHING handles race conditions.
     """
     if created:
-        UserProfile.objects.get_or_create(user=instance)
+        UserProfile.objects.bulk_create([UserProfile(user=instance)], ignore_conflicts=True)
+        # UserProfile(user=instance) cached that unsaved, pk-less object as
+        # instance.profile; drop it so the next access loads the real row
+        instance._state.fields_cache.pop("profile", None)
 
         from django.dispatch import receiver
+from allauth.account.models import EmailAddress
 from allauth.account.signals import email_confirmed
+from allauth.socialaccount.models import SocialApp
+from django.db.models.signals import m2m_changed, post_delete, pre_save
+from apps.accounts.cache import invalidate_social_apps, invalidate_verified_email
 from django.contrib.auth import get_user_model
 
 User = get_user_model()
 
 @receiver(email_confirmed)
 def activate_user_on_email_confirm(request, email_address, **kwargs):
-    user = email_address.user
+    """Activate the owner of a confirmed address with a single UPDATE."""
+    User.objects.filter(pk=email_address.user_id, is_active=False).update(is_active=True)
 
-    
-    user.is_active = True
-    user.save(update_fields=["is_active"])
+
+def _invalidate_previous_email(model, instance, update_fields, fields):
+    """
+    Drop the cached login entry for the email ``instance`` had before this
+    save. Only full saves and saves touching ``fields`` pay the PK lookup.
+    """
+    if instance._state.adding or instance.pk is None:
+        return
+    if update_fields is not None and not set(fields) & set(update_fields):
+        return
+    old_email = model.objects.filter(pk=instance.pk).values_list("email", flat=True).first()
+    if old_email:
+        invalidate_verified_email(old_email)
+
+
+@receiver(pre_save, sender=EmailAddress)
+def invalidate_verified_email_on_address_change(sender, instance, update_fields=None, **kwargs):
+    """An address that is unverified or changed must not keep the login fast path."""
+    _invalidate_previous_email(sender, instance, update_fields, ("email", "verified", "user"))
+
+
+@receiver(post_save, sender=EmailAddress)
+@receiver(post_delete, sender=EmailAddress)
+def invalidate_verified_email_on_address_save(sender, instance, **kwargs):
+    """Drop the cached login entry for a saved or deleted address."""
+    invalidate_verified_email(instance.email)
+
+
+@receiver(pre_save, sender=User)
+def invalidate_verified_email_on_user_change(sender, instance, update_fields=None, **kwargs):
+    """A user whose email or active flag changes must not keep the login fast path."""
+    _invalidate_previous_email(sender, instance, update_fields, ("email", "is_active"))
+
+
+@receiver(post_delete, sender=User)
+def invalidate_verified_email_on_user_delete(sender, instance, **kwargs):
+    """Drop the cached login entry of a deleted user."""
+    invalidate_verified_email(instance.email)
+
+
+@receiver(post_save, sender=SocialApp)
+@receiver(post_delete, sender=SocialApp)
+@receiver(m2m_changed, sender=SocialApp.sites.through)
+def invalidate_social_apps_on_change(sender, **kwargs):
+    """Cached SocialApp lookups must not outlive credential or site changes."""
+    invalidate_social_apps()
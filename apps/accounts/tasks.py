@@ -0,0 +1,173 @@
+# apps/accounts/tasks.py
+"""
+Celery tasks for account management.
+
+Tasks:
+- send_email_confirmation: Send the allauth verification email for an
+  EmailAddress outside the request/response cycle.
+- blacklist_refresh_token: Blacklist a refresh token after logout.
+- send_password_reset_email: Send a frontend password reset link.
+"""
+
+import logging
+from celery import shared_task
+from django.conf import settings
+from django.contrib.auth.tokens import default_token_generator
+from django.db import transaction
+from django.utils.encoding import force_bytes
+from django.utils.http import urlsafe_base64_encode
+
+logger = logging.getLogger(__name__)
+
+
+@shared_task(
+    bind=True,
+    max_retries=3,
+    default_retry_delay=60,
+    autoretry_for=(Exception,),
+)
+def send_email_confirmation(self, email_address_id):
+    """
+    Send the verification email for an EmailAddress.
+
+    allauth supports sending confirmations without a request; the
+    activation URL is then built from the current Site.
+    """
+    from allauth.account.models import EmailAddress
+
+    email_address = (
+        EmailAddress.objects.select_related("user")
+        .filter(pk=email_address_id, verified=False)
+        .first()
+    )
+    if email_address is None:
+        # Deleted or verified in the meantime - nothing to send
+        return
+    email_address.send_confirmation()
+
+
+def celery_enabled():
+    """
+    Whether tasks can be handed to a worker.
+
+    Without CELERY_BROKER_URL there is nothing to publish to (Celery would
+    try its default amqp://localhost), so callers run the work inline.
+    """
+    return bool(getattr(settings, "CELERY_BROKER_URL", ""))
+
+
+def queue_email_confirmation(email_address, request=None):
+    """
+    Queue send_email_confirmation once the current transaction commits.
+
+    Sends inline (still after commit, so SMTP never holds the transaction
+    open or rolls back the signup) when no broker is configured, and falls
+    back to sending inline if the broker cannot be reached, so the user
+    still receives a verification email.
+    """
+    if not celery_enabled():
+        transaction.on_commit(lambda: email_address.send_confirmation(request))
+        return
+
+    def dispatch():
+        try:
+            send_email_confirmation.delay(email_address.pk)
+        except Exception:
+            logger.exception(
+                "Could not queue verification email for %s, sending inline",
+                email_address.email,
+            )
+            email_address.send_confirmation(request)
+
+    transaction.on_commit(dispatch)
+
+
+@shared_task
+def blacklist_refresh_token(refresh_token):
+    """
+    Blacklist a refresh token (OutstandingToken + BlacklistedToken writes).
+
+    The token was already decoded and validated by logout_api; a token
+    that expires before the worker picks it up no longer needs blacklisting.
+    """
+    from rest_framework_simplejwt.exceptions import TokenError
+    from rest_framework_simplejwt.tokens import RefreshToken
+
+    try:
+        RefreshToken(refresh_token).blacklist()
+    except TokenError as e:
+        logger.warning("Failed to blacklist token: %s", e)
+
+
+def queue_refresh_token_blacklist(refresh_token):
+    """
+    Queue blacklist_refresh_token, blacklisting inline when no broker is
+    configured or the broker cannot be reached so a logged-out refresh
+    token never stays usable.
+    """
+    if not celery_enabled():
+        refresh_token.blacklist()
+        return
+    try:
+        blacklist_refresh_token.delay(str(refresh_token))
+    except Exception:
+        logger.exception("Could not queue refresh token blacklist, running inline")
+        refresh_token.blacklist()
+
+
+@shared_task(
+    bind=True,
+    max_retries=3,
+    default_retry_delay=60,
+    autoretry_for=(Exception,),
+)
+def send_password_reset_email(self, user_pk, email):
+    """
+    Send a password reset link pointing at the frontend (FRONTEND_URL).
+
+    The reset token is generated here rather than in the request. Uses
+    allauth's default password_reset_key template; without a request the
+    adapter renders it against the current Site.
+    """
+    from django.contrib.auth import get_user_model
+
+    user = get_user_model().objects.filter(pk=user_pk).first()
+    if user is None:
+        return
+    _send_password_reset_email(user, email)
+
+
+def _send_password_reset_email(user, email, request=None):
+    from allauth.account.adapter import get_adapter
+
+    frontend_url = getattr(settings, "FRONTEND_URL", "http://localhost:3000").rstrip("/")
+    uid = urlsafe_base64_encode(force_bytes(user.pk))
+    token = default_token_generator.make_token(user)
+
+    context = {
+        "user": user,
+        "password_reset_url": f"{frontend_url}/reset-password?uid={uid}&token={token}",
+        "request": request,
+    }
+    get_adapter(request).send_mail("account/email/password_reset_key", email, context)
+
+
+def queue_password_reset_email(request, user, email):
+    """
+    Queue send_password_reset_email once the current transaction commits,
+    sending inline when no broker is configured or it cannot be reached.
+    """
+    if not celery_enabled():
+        _send_password_reset_email(user, email, request)
+        return
+
+    def dispatch():
+        try:
+            send_password_reset_email.delay(user.pk, email)
+        except Exception:
+            logger.exception(
+                "Could not queue password reset email for %s, sending inline", email
+            )
+            _send_password_reset_email(user, email, request)
+
+    transaction.on_commit(dispatch)
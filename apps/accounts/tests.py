@@ -1,9 +1,15 @@
 import json
-from django.test import TestCase, Client
+from django.contrib.messages.storage.fallback import FallbackStorage
+from django.contrib.sessions.middleware import SessionMiddleware
+from django.db import connection
+from django.test import TestCase, Client, RequestFactory
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from django.contrib.auth import get_user_model
 from apps.profiles.models import UserProfile
+from allauth.account.models import EmailAddress, EmailConfirmationHMAC
 from allauth.socialaccount.models import SocialAccount
+from apps.accounts.views import verify_email_api
 import unittest
 from unittest.mock import patch, MagicMock
 
@@ -153,4 +159,47 @@ class OAuthIntegrationTest(TestCase):
         else:
             # If different endpoint, just check it responds
             response = self.client.get('/')
-            self.assertEqual(response.status_code, 200)
\ No newline at end of file
+            self.assertEqual(response.status_code, 200)
+
+
+class VerifyEmailTest(TestCase):
+    """verify_email_api (called directly; it is not routed in config/urls.py)"""
+
+    def setUp(self):
+        self.factory = RequestFactory()
+        self.user = User.objects.create_user(
+            username='verify_user',
+            email='verify@example.com',
+            password='testpass123',
+            is_active=False,
+        )
+        self.email_address = EmailAddress.objects.create(
+            user=self.user, email=self.user.email, verified=False, primary=True
+        )
+
+    def _get(self, key):
+        request = self.factory.get(f'/api/auth/verify-email/{key}/')
+        # confirm() adds a "confirmed" message; give it a session to store in
+        SessionMiddleware(lambda r: None).process_request(request)
+        request._messages = FallbackStorage(request)
+        return verify_email_api(request, key)
+
+    def test_verification_activates_user_with_one_update(self):
+        """Confirming an address writes the user row exactly once"""
+        key = EmailConfirmationHMAC(self.email_address).key
+        user_table = connection.ops.quote_name(User._meta.db_table)
+
+        with CaptureQueriesContext(connection) as ctx:
+            response = self._get(key)
+
+        self.assertEqual(response.status_code, 200)
+        user_updates = [
+            q['sql'] for q in ctx.captured_queries
+            if q['sql'].startswith('UPDATE') and user_table in q['sql']
+        ]
+        self.assertEqual(len(user_updates), 1)
+
+        self.user.refresh_from_db()
+        self.email_address.refresh_from_db()
+        self.assertTrue(self.user.is_active)
+        self.assertTrue(self.email_address.verified)
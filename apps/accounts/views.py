@@ -1,7 +1,14 @@
+import re
+
 from allauth.account.models import EmailConfirmation, EmailConfirmationHMAC
-from django.http import JsonResponse
+from django.db import transaction
+from django.http import Http404, JsonResponse
 from django.views.decorators.http import require_GET
-from django.shortcuts import get_object_or_404
+
+from .cache import cache_confirmation_miss, is_confirmation_miss
+
+# Same charset allauth's confirm-email URL accepts (HMAC and DB keys)
+_CONFIRMATION_KEY_RE = re.compile(r"[-:\w]{1,255}")
 
 @require_GET
 def verify_email_api(request, key):
@@ -9,14 +16,19 @@ def verify_email_api(request, key):
     Verify email using token.
     No redirect. No login. Just verification.
     """
-    confirmation = None
+    # Malformed or recently unknown keys are rejected without a query
+    if not _CONFIRMATION_KEY_RE.fullmatch(key) or is_confirmation_miss(key):
+        raise Http404("No EmailConfirmation matches the given query.")
 
     # Try HMAC-based confirmation (modern allauth)
     confirmation = EmailConfirmationHMAC.from_key(key)
 
     # Fallback for DB-based confirmation
     if confirmation is None:
-        confirmation = get_object_or_404(EmailConfirmation, key=key)
+        confirmation = EmailConfirmation.objects.filter(key=key).first()
+        if confirmation is None:
+            cache_confirmation_miss(key)
+            raise Http404("No EmailConfirmation matches the given query.")
 
     email_address = confirmation.email_address
 
@@ -30,13 +42,10 @@ def verify_email_api(request, key):
             status=200,
         )
 
-    # Confirm (this does everything correctly)
-    confirmation.confirm(request)
-
-    # Activate user explicitly (important)
-    user = email_address.user
-    user.is_active = True
-    user.save(update_fields=["is_active"])
+    # Confirm (this does everything correctly). The email_confirmed receiver
+    # in signals.py activates the user inside the same transaction.
+    with transaction.atomic():
+        confirmation.confirm(request)
 
     return JsonResponse(
         {
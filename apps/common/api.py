@@ -3,13 +3,50 @@
 API endpoints for common functionality.
 """
 
-from rest_framework.decorators import api_view, permission_classes
+import gzip
+import hashlib
+
+from django.http import HttpResponse, HttpResponseNotModified
+from django.utils.cache import patch_cache_control, patch_vary_headers
+from django.utils.http import parse_etags, quote_etag
+from rest_framework.decorators import api_view, authentication_classes, permission_classes
 from rest_framework.permissions import AllowAny
-from rest_framework.response import Response
 from drf_yasg.utils import swagger_auto_schema
 from drf_yasg import openapi
 
-from .enums import get_all_enums
+from .enums import ALL_ENUMS_JSON
+
+# The enums body is static, so its compressed form and validator are built once
+ALL_ENUMS_JSON_GZIP = gzip.compress(ALL_ENUMS_JSON, compresslevel=9, mtime=0)
+ALL_ENUMS_ETAG = quote_etag(hashlib.blake2s(ALL_ENUMS_JSON, digest_size=16).hexdigest())
+ENUMS_MAX_AGE = 86400  # 1 day
+
+
+def _accepts_gzip(accept_encoding):
+    """
+    True if an Accept-Encoding header allows gzip.
+
+    Honours q-values: "gzip;q=0" refuses gzip, and "*" covers gzip when it
+    is not listed itself.
+    """
+    wildcard = False
+    for item in accept_encoding.split(","):
+        coding, _, params = item.partition(";")
+        coding = coding.strip().lower()
+        if coding not in ("gzip", "x-gzip", "*"):
+            continue
+        qvalue = 1.0
+        for param in params.split(";"):
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    qvalue = float(value)
+                except ValueError:
+                    qvalue = 0.0
+        if coding != "*":
+            return qvalue > 0
+        wildcard = qvalue > 0
+    return wildcard
 
 
 @swagger_auto_schema(
@@ -64,6 +101,7 @@ from .enums import get_all_enums
     }
 )
 @api_view(['GET'])
+@authentication_classes([])
 @permission_classes([AllowAny])
 def enums_api(request):
     """
@@ -72,5 +110,20 @@ def enums_api(request):
     Returns read-only constants used across onboarding and profiles.
     No authentication required.
     No database writes.
+
+    Authentication is skipped (no user query for bearer tokens) and the
+    pre-encoded body is returned as a plain HttpResponse, so DRF does no
+    rendering or content negotiation.
     """
-    return Response(get_all_enums())
+    if ALL_ENUMS_ETAG in parse_etags(request.headers.get("If-None-Match", "")):
+        response = HttpResponseNotModified()
+    elif _accepts_gzip(request.headers.get("Accept-Encoding", "")):
+        response = HttpResponse(ALL_ENUMS_JSON_GZIP, content_type="application/json")
+        response["Content-Encoding"] = "gzip"
+    else:
+        response = HttpResponse(ALL_ENUMS_JSON, content_type="application/json")
+
+    response["ETag"] = ALL_ENUMS_ETAG
+    patch_cache_control(response, public=True, max_age=ENUMS_MAX_AGE)
+    patch_vary_headers(response, ("Accept-Encoding",))
+    return response
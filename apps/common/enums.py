@@ -5,9 +5,11 @@ Single source of truth for frontend and backend.
 
 These values are exposed via GET /api/enums/ endpoint.
 """
+import functools
+import json
 
 # ========== PHONE PREFIXES ==========
-PHONE_PREFIXES = [
+PHONE_PREFIXES = (
     {"code": "+91", "country": "India"},
     {"code": "+1", "country": "United States"},
     {"code": "+44", "country": "United Kingdom"},
@@ -28,10 +30,10 @@ PHONE_PREFIXES = [
     {"code": "+7", "country": "Russia"},
     {"code": "+82", "country": "South Korea"},
     {"code": "+39", "country": "Italy"},
-]
+)
 
 # ========== DESIGNATION OPTIONS ==========
-DESIGNATION_OPTIONS = [
+DESIGNATION_OPTIONS = (
     "Software Developer",
     "Frontend Developer",
     "Backend Developer",
@@ -62,10 +64,10 @@ DESIGNATION_OPTIONS = [
     "Blockchain Developer",
     "Game Developer",
     "Embedded Systems Engineer",
-]
+)
 
 # ========== SKILLS ==========
-SKILLS = [
+SKILLS = (
     # Programming Languages
     "Python",
     "JavaScript",
@@ -143,10 +145,10 @@ SKILLS = [
     "Git",
     "Agile/Scrum",
     "Testing",
-]
+)
 
 # ========== LANGUAGES ==========
-LANGUAGES = [
+LANGUAGES = (
     "English",
     "Hindi",
     "Spanish",
@@ -174,10 +176,10 @@ LANGUAGES = [
     "Gujarati",
     "Kannada",
     "Malayalam",
-]
+)
 
 # ========== TARGET ROLES ==========
-TARGET_ROLES = [
+TARGET_ROLES = (
     "Junior Software Engineer",
     "Software Engineer",
     "Senior Software Engineer",
@@ -208,26 +210,26 @@ TARGET_ROLES = [
     "Security Engineer",
     "QA Engineer",
     "Mobile Developer",
-]
+)
 
 # ========== CAREER GOALS ==========
-CAREER_GOALS = [
+CAREER_GOALS = (
     {"value": "finding_jobs", "label": "Finding Jobs", "description": "Looking for new job opportunities"},
     {"value": "switching_jobs", "label": "Switching Jobs", "description": "Looking to switch from current job"},
-]
+)
 
 # ========== EXPERTISE LEVELS ==========
-EXPERTISE_LEVELS = [
+EXPERTISE_LEVELS = (
     {"value": "beginner", "label": "Beginner", "description": "0-2 years of experience"},
     {"value": "intermediate", "label": "Intermediate", "description": "2-5 years of experience"},
     {"value": "expert", "label": "Expert", "description": "5+ years of experience"},
-]
+)
 
 # ========== ROLES ==========
-USER_ROLES = [
+USER_ROLES = (
     {"value": "attender", "label": "Interview Attender", "description": "Can attend interviews and send interview requests"},
     {"value": "taker", "label": "Interview Taker", "description": "Can conduct interviews and receive interview requests"},
-]
+)
 
 # ========== EXPERIENCE YEARS RANGE ==========
 EXPERIENCE_YEARS = {
@@ -237,7 +239,7 @@ EXPERIENCE_YEARS = {
 }
 
 # ========== DAYS OF WEEK ==========
-DAYS_OF_WEEK = [
+DAYS_OF_WEEK = (
     {"value": "monday", "label": "Monday"},
     {"value": "tuesday", "label": "Tuesday"},
     {"value": "wednesday", "label": "Wednesday"},
@@ -245,13 +247,15 @@ DAYS_OF_WEEK = [
     {"value": "friday", "label": "Friday"},
     {"value": "saturday", "label": "Saturday"},
     {"value": "sunday", "label": "Sunday"},
-]
+)
 
 
+@functools.lru_cache(maxsize=1)
 def get_all_enums():
     """
     Returns all enums as a single dictionary.
     This is what the /api/enums/ endpoint returns.
+    Built once and shared; callers must not mutate the result.
     """
     return {
         "phone_prefixes": PHONE_PREFIXES,
@@ -265,3 +269,7 @@ def get_all_enums():
         "experience_years": EXPERIENCE_YEARS,
         "days_of_week": DAYS_OF_WEEK,
     }
+
+
+# The constants never change at runtime, so the endpoint body is encoded once
+ALL_ENUMS_JSON = json.dumps(get_all_enums(), separators=(",", ":")).encode()
@@ -25,9 +25,27 @@ Usage:
             "previous": "...?limit=10&offset=0", → URL for previous page (or null)
             "results": [...]             → Paginated data array
         }
+
+Cursor (keyset) pagination:
+    StandardCursorPagination is opted into per view with
+    ``pagination_class``. It pages on an indexed, strictly ordered column
+    (WHERE created_at < :cursor ... LIMIT :n), so deep pages cost the same
+    as the first one instead of scanning and discarding OFFSET rows.
+
+    Query Parameters:
+        - cursor: Opaque position token taken from the next/previous links
+        - limit: Number of items to return (default: 10, max: 100)
+        - offset: Falls back to limit/offset paging when sent without cursor
+
+    Response Format:
+        {
+            "next": "...?cursor=cD0yMDI2LTAx...",   → URL for next page (or null)
+            "previous": null,                      → URL for previous page (or null)
+            "results": [...]
+        }
 """
 
-from rest_framework.pagination import LimitOffsetPagination
+from rest_framework.pagination import CursorPagination, LimitOffsetPagination
 
 
 class StandardLimitOffsetPagination(LimitOffsetPagination):
@@ -64,6 +82,9 @@ class StandardLimitOffsetPagination(LimitOffsetPagination):
     # Template for pagination controls in browsable API (optional)
     template = 'rest_framework/pagination/numbers.html'
     
+    # OpenAPI parameters, built on first use (see get_schema_operation_parameters)
+    _schema_parameters = None
+    
     def get_limit(self, request):
         """
         Override to ensure limit is always within bounds.
@@ -86,9 +107,19 @@ class StandardLimitOffsetPagination(LimitOffsetPagination):
         This method is called by drf-yasg to generate the query parameters
         in the Swagger UI for list endpoints.
         
+        The list is built once per pagination class and reused; callers
+        get a fresh list object holding the shared parameter dicts.
+        
         Returns:
             list: List of OpenAPI parameter dictionaries
         """
+        cls = type(self)
+        if cls.__dict__.get('_schema_parameters') is None:
+            cls._schema_parameters = self._build_schema_operation_parameters()
+        return list(cls._schema_parameters)
+    
+    def _build_schema_operation_parameters(self):
+        """Build the OpenAPI parameter dicts from the limit/offset settings."""
         return [
             {
                 'name': self.limit_query_param,
@@ -123,3 +154,47 @@ class StandardLimitOffsetPagination(LimitOffsetPagination):
             },
         ]
 
+
+class StandardCursorPagination(CursorPagination):
+    """
+    Keyset pagination for large, strictly ordered list endpoints.
+
+    Views opt in with ``pagination_class = StandardCursorPagination`` and
+    must return a queryset that can still be filtered and ordered (no
+    slicing). Requests that send ``offset`` without ``cursor`` are served
+    by StandardLimitOffsetPagination so existing offset callers keep working.
+
+    Attributes:
+        ordering (tuple): Newest first; ``id`` breaks ties between rows
+            created in the same instant
+        page_size (int): Default number of items per page (10)
+        max_page_size (int): Maximum allowed items per request (100)
+        page_size_query_param (str): Query parameter name for page size ('limit')
+    """
+
+    ordering = ('-created_at', '-id')
+    page_size = 10
+    max_page_size = 100
+    page_size_query_param = 'limit'
+    cursor_query_param = 'cursor'
+
+    # Legacy parameter that switches a request to limit/offset paging
+    offset_query_param = StandardLimitOffsetPagination.offset_query_param
+
+    # Set per request when limit/offset paging is used instead
+    fallback = None
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.fallback = None
+        if (
+            self.offset_query_param in request.query_params
+            and self.cursor_query_param not in request.query_params
+        ):
+            self.fallback = StandardLimitOffsetPagination()
+            return self.fallback.paginate_queryset(queryset, request, view)
+        return super().paginate_queryset(queryset, request, view)
+
+    def get_paginated_response(self, data):
+        if self.fallback is not None:
+            return self.fallback.get_paginated_response(data)
+        return super().get_paginated_response(data)
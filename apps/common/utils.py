@@ -1,13 +1,17 @@
 # apps/common/utils.py
-from django.http import JsonResponse
+from django.http import HttpResponse
 from django.conf import settings
 from rest_framework.views import exception_handler
 from rest_framework.response import Response
 from rest_framework import status as http_status
+import json
 import logging
 
 logger = logging.getLogger(__name__)
 
+# DEBUG is fixed for the life of the process; read it once
+_DEBUG = getattr(settings, 'DEBUG', False)
+
 
 def custom_exception_handler(exc, context):
     """
@@ -27,6 +31,18 @@ def custom_exception_handler(exc, context):
     
     if response is not None:
         # DRF successfully handled the exception (400, 401, 403, 404, etc.)
+        data = response.data
+
+        # Fast path for the most common shape: {"detail": "..."} alone
+        # (authentication, permission, not found, throttling)
+        if isinstance(data, dict) and len(data) == 1 and 'detail' in data:
+            response.data = {
+                'error': True,
+                'status_code': response.status_code,
+                'message': str(data['detail']),
+            }
+            return response
+
         # Standardize the error format
         custom_response_data = {
             'error': True,
@@ -36,13 +52,12 @@ def custom_exception_handler(exc, context):
         # Extract error message
         if isinstance(response.data, dict):
             # If there's a 'detail' key, use it as the main message
+            # (the single-key case is handled above)
             if 'detail' in response.data:
                 custom_response_data['message'] = str(response.data['detail'])
-                # Include other fields as details if present
-                if len(response.data) > 1:
-                    custom_response_data['details'] = {
-                        k: v for k, v in response.data.items() if k != 'detail'
-                    }
+                custom_response_data['details'] = {
+                    k: v for k, v in response.data.items() if k != 'detail'
+                }
             else:
                 # Use all data as details
                 custom_response_data['message'] = 'Validation error' if response.status_code == 400 else 'Request failed'
@@ -58,7 +73,7 @@ def custom_exception_handler(exc, context):
     
     # Handle unhandled exceptions (500 errors)
     # These are exceptions that DRF didn't catch
-    logger.exception(f"Unhandled exception in {context.get('view', 'unknown view')}: {exc}")
+    logger.exception("Unhandled exception in %s: %s", context.get('view', 'unknown view'), exc)
     
     # Build error response
     error_response = {
@@ -68,7 +83,7 @@ def custom_exception_handler(exc, context):
     }
     
     # Include exception details only in DEBUG mode
-    if settings.DEBUG:
+    if _DEBUG:
         error_response['debug'] = {
             'exception_type': exc.__class__.__name__,
             'exception_message': str(exc),
@@ -80,21 +95,27 @@ def custom_exception_handler(exc, context):
     return Response(error_response, status=http_status.HTTP_500_INTERNAL_SERVER_ERROR)
 
 
+# Static JSON bodies for the 404/500 handlers, serialized once at import
+_404_JSON = json.dumps({
+    'error': 'Not Found',
+    'message': 'The requested resource was not found.'
+}).encode()
+
+_500_JSON = json.dumps({
+    'error': 'Internal Server Error',
+    'message': 'An unexpected error occurred on the server.'
+}).encode()
+
+
 def custom_404(request, exception=None):
     """
     Custom 404 error handler that returns JSON.
     """
-    return JsonResponse({
-        'error': 'Not Found',
-        'message': 'The requested resource was not found.'
-    }, status=404)
+    return HttpResponse(_404_JSON, content_type='application/json', status=404)
 
 
 def custom_500(request):
     """
     Custom 500 error handler that returns JSON.
     """
-    return JsonResponse({
-        'error': 'Internal Server Error',
-        'message': 'An unexpected error occurred on the server.'
-    }, status=500)
+    return HttpResponse(_500_JSON, content_type='application/json', status=500)
@@ -14,16 +14,20 @@ Note: Admin endpoints have been removed
 """
 
 import logging
+import uuid
 from rest_framework import status
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.generics import ListAPIView
-from django.shortcuts import get_object_or_404
+from django.contrib.auth import get_user_model
 from drf_yasg.utils import swagger_auto_schema
 from drf_yasg import openapi
 
-from .models import CreditBalance, CreditTransaction, TakerEarnings
+from apps.common.pagination import StandardCursorPagination
+from apps.profiles.cache import get_interviewer_credits
+
+from .models import CreditTransaction, TakerEarnings
 from .serializers import (
     CreditBalanceSerializer,
     CreditTransactionSerializer,
@@ -33,6 +37,20 @@ from .serializers import (
 from .services import CreditService
 
 logger = logging.getLogger(__name__)
+User = get_user_model()
+
+# Columns CreditTransactionSerializer reads
+TRANSACTION_LIST_FIELDS = (
+    'id',
+    'user__email',
+    'transaction_type',
+    'status',
+    'amount',
+    'balance_after',
+    'description',
+    'interview_request__uuid_id',
+    'created_at',
+)
 
 
 class CreditBalanceAPI(APIView):
@@ -56,23 +74,22 @@ class CreditBalanceAPI(APIView):
         }
     )
     def get(self, request):
-        user = request.user
+        # Balance and profile in one join; a missing balance reads as None
+        user = User.objects.select_related('credit_balance', 'profile').get(pk=request.user.pk)
+        balance = getattr(user, 'credit_balance', None)
         
-        try:
-            balance = user.credit_balance
-            serializer = CreditBalanceSerializer(balance)
-            return Response(serializer.data, status=status.HTTP_200_OK)
-        except CreditBalance.DoesNotExist:
+        if balance is None:
             # Create balance if user is attender
-            if hasattr(user, 'profile') and user.profile.is_attender():
-                balance = CreditService.get_or_create_balance(user)
-                serializer = CreditBalanceSerializer(balance)
-                return Response(serializer.data, status=status.HTTP_200_OK)
-            
-            return Response(
-                {"detail": "No credit balance found. Balance is only available for attenders."},
-                status=status.HTTP_404_NOT_FOUND
-            )
+            profile = getattr(user, 'profile', None)
+            if profile is None or not profile.is_attender():
+                return Response(
+                    {"detail": "No credit balance found. Balance is only available for attenders."},
+                    status=status.HTTP_404_NOT_FOUND
+                )
+            balance = CreditService.get_or_create_balance(user)
+        
+        serializer = CreditBalanceSerializer(balance)
+        return Response(serializer.data, status=status.HTTP_200_OK)
 
 
 class TakerEarningsAPI(APIView):
@@ -94,23 +111,22 @@ class TakerEarningsAPI(APIView):
         }
     )
     def get(self, request):
-        user = request.user
+        # Earnings and profile in one join; missing earnings read as None
+        user = User.objects.select_related('taker_earnings', 'profile').get(pk=request.user.pk)
+        earnings = getattr(user, 'taker_earnings', None)
         
-        try:
-            earnings = user.taker_earnings
-            serializer = TakerEarningsSerializer(earnings)
-            return Response(serializer.data, status=status.HTTP_200_OK)
-        except TakerEarnings.DoesNotExist:
+        if earnings is None:
             # Create earnings record if user is taker
-            if hasattr(user, 'profile') and user.profile.is_taker():
-                earnings, _ = TakerEarnings.objects.get_or_create(user=user)
-                serializer = TakerEarningsSerializer(earnings)
-                return Response(serializer.data, status=status.HTTP_200_OK)
-            
-            return Response(
-                {"detail": "No earnings found. Earnings are only available for interviewers."},
-                status=status.HTTP_404_NOT_FOUND
-            )
+            profile = getattr(user, 'profile', None)
+            if profile is None or not profile.is_taker():
+                return Response(
+                    {"detail": "No earnings found. Earnings are only available for interviewers."},
+                    status=status.HTTP_404_NOT_FOUND
+                )
+            earnings, _ = TakerEarnings.objects.get_or_create(user=user)
+        
+        serializer = TakerEarningsSerializer(earnings)
+        return Response(serializer.data, status=status.HTTP_200_OK)
 
 
 class CreditTransactionListAPI(ListAPIView):
@@ -119,6 +135,7 @@ class CreditTransactionListAPI(ListAPIView):
     """
     permission_classes = [IsAuthenticated]
     serializer_class = CreditTransactionSerializer
+    pagination_class = StandardCursorPagination
     
     @swagger_auto_schema(
         operation_summary="Get Transaction History",
@@ -127,7 +144,17 @@ class CreditTransactionListAPI(ListAPIView):
         manual_parameters=[
             openapi.Parameter(
                 'limit', openapi.IN_QUERY,
-                description='Maximum number of transactions to return (default: 50)',
+                description='Number of transactions per page (default: 10, max: 100)',
+                type=openapi.TYPE_INTEGER
+            ),
+            openapi.Parameter(
+                'cursor', openapi.IN_QUERY,
+                description='Page position taken from the next/previous links',
+                type=openapi.TYPE_STRING
+            ),
+            openapi.Parameter(
+                'offset', openapi.IN_QUERY,
+                description='Legacy limit/offset paging, used when no cursor is sent',
                 type=openapi.TYPE_INTEGER
             ),
             openapi.Parameter(
@@ -143,15 +170,23 @@ class CreditTransactionListAPI(ListAPIView):
     
     def get_queryset(self):
         user = self.request.user
-        limit = int(self.request.query_params.get('limit', 50))
         txn_type = self.request.query_params.get('type')
         
-        queryset = CreditTransaction.objects.filter(user=user).order_by('-created_at')
+        # Paging (limit/cursor/offset) is left to the paginator, which also
+        # applies the newest-first ordering
+        queryset = (
+            CreditTransaction.objects.filter(user=user)
+            # Join what the serializer reads (user email, interview uuid) and
+            # load only the columns it renders
+            .select_related('user', 'interview_request')
+            .only(*TRANSACTION_LIST_FIELDS)
+            .order_by('-created_at', '-id')
+        )
         
         if txn_type:
             queryset = queryset.filter(transaction_type=txn_type)
         
-        return queryset[:limit]
+        return queryset
 
 
 class CreditSummaryAPI(APIView):
@@ -174,7 +209,8 @@ class CreditSummaryAPI(APIView):
         }
     )
     def get(self, request):
-        user = request.user
+        # One joined load serves the role checks, balance and earnings below
+        user = CreditService.get_user_with_credits(request.user)
         profile = getattr(user, 'profile', None)
         
         is_attender = profile.is_attender() if profile else False
@@ -236,8 +272,6 @@ class CheckCreditsAPI(APIView):
         }
     )
     def get(self, request):
-        from apps.profiles.models import UserProfile
-        
         taker_uuid = request.query_params.get('taker_uuid')
         if not taker_uuid:
             return Response(
@@ -246,18 +280,18 @@ class CheckCreditsAPI(APIView):
             )
         
         try:
-            taker_profile = UserProfile.objects.select_related('user').get(public_id=taker_uuid)
-        except UserProfile.DoesNotExist:
+            taker_uuid = uuid.UUID(taker_uuid)
+        except ValueError:
+            taker_uuid = None
+        
+        # Credits required from the interviewer profile (cached briefly)
+        pricing = get_interviewer_credits(taker_uuid) if taker_uuid else None
+        if pricing is None:
             return Response(
                 {"detail": "Interviewer not found."},
                 status=status.HTTP_404_NOT_FOUND
             )
-        
-        # Get credits required from interviewer profile
-        try:
-            credits_required = taker_profile.interviewer_profile.credits_per_interview
-        except Exception:
-            credits_required = 0
+        credits_required = pricing["credits_per_interview"]
         
         # Check if attender can afford
         can_afford, balance, message = CreditService.check_can_request_interview(
@@ -1,11 +1,17 @@
 from django.core.management.base import BaseCommand
 from django.contrib.auth import get_user_model
-from apps.profiles.models import UserProfile, Role
+from apps.profiles.models import Role
 from apps.credits.services import CreditService
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Users credited per transaction
+BATCH_SIZE = 1000
+
+# Emails listed by --dry-run
+DRY_RUN_PREVIEW = 50
+
 
 class Command(BaseCommand):
     help = 'Award initial credits to existing users who are attenders but did not receive the signup bonus.'
@@ -17,40 +23,46 @@ class Command(BaseCommand):
         dry_run = options.get('dry_run')
         User = get_user_model()
 
-        profiles = UserProfile.objects.filter(roles__name=Role.ATTENDER, roles__is_active=True).select_related('user')
-        total = 0
+        attenders = User.objects.filter(
+            profile__roles__name=Role.ATTENDER, profile__roles__is_active=True
+        ).distinct()
+        missing = attenders.exclude(credit_balance__has_received_initial_credits=True)
+
+        total = attenders.count()
+
+        if dry_run:
+            missing_count = missing.count()
+            for email in missing.values_list('email', flat=True)[:DRY_RUN_PREVIEW]:
+                self.stdout.write(f"AWARD {email}: awarding initial credits")
+            if missing_count > DRY_RUN_PREVIEW:
+                self.stdout.write(f"... and {missing_count - DRY_RUN_PREVIEW} more")
+            self.stdout.write("")
+            self.stdout.write(f"Profiles scanned: {total}")
+            self.stdout.write(f"Would award: {missing_count}")
+            self.stdout.write(f"Skipped: {total - missing_count}")
+            return
+
+        user_ids = list(missing.values_list('id', flat=True))
         awarded = 0
-        skipped = 0
+        # Already credited before the run; users credited concurrently are
+        # added per batch below
+        skipped = total - len(user_ids)
+        errors = 0
 
-        for profile in profiles.distinct():
-            total += 1
-            user = profile.user
+        for start in range(0, len(user_ids), BATCH_SIZE):
+            batch = user_ids[start:start + BATCH_SIZE]
             try:
-                balance = getattr(user, 'credit_balance', None)
-                has_received = False
-                if balance is not None:
-                    has_received = bool(balance.has_received_initial_credits)
-
-                if has_received:
-                    skipped += 1
-                    self.stdout.write(f"SKIP {user.email}: already received initial credits")
-                    continue
-
-                self.stdout.write(f"AWARD {user.email}: awarding initial credits")
-                if not dry_run:
-                    success, message, txn = CreditService.award_initial_credits(user)
-                    if success:
-                        awarded += 1
-                        self.stdout.write(f"  -> success: {message}")
-                    else:
-                        skipped += 1
-                        self.stdout.write(f"  -> skipped: {message}")
-
+                credited = CreditService.award_initial_credits_bulk(batch)
             except Exception as e:
-                logger.exception(f"Failed to award credits for {user.email}: {e}")
-                self.stderr.write(f"ERROR {user.email}: {e}")
+                errors += len(batch)
+                logger.exception("Failed to award credits for batch starting at %s", start)
+                self.stderr.write(f"ERROR batch {start}-{start + len(batch) - 1}: {e}")
+                continue
+            awarded += credited
+            skipped += len(batch) - credited
 
         self.stdout.write("")
         self.stdout.write(f"Profiles scanned: {total}")
         self.stdout.write(f"Awarded: {awarded}")
-        self.stdout.write(f"Skipped: {skipped}")
\ No newline at end of file
+        self.stdout.write(f"Skipped: {skipped}")
+        self.stdout.write(f"Errors: {errors}")
@@ -0,0 +1,21 @@
+# Generated by Django 6.0.1 on 2026-10-17 14:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('credits', '0002_remove_legacy_feedback_models'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='credittransaction',
+            name='credits_cre_user_id_6943f8_idx',
+        ),
+        migrations.AddIndex(
+            model_name='credittransaction',
+            index=models.Index(fields=['user', '-created_at', '-id'], name='credittxn_user_ct_idx'),
+        ),
+    ]
@@ -253,7 +253,8 @@ class CreditTransaction(models.Model):
         verbose_name_plural = 'Credit Transactions'
         ordering = ['-created_at']
         indexes = [
-            models.Index(fields=['user', '-created_at']),
+            # Serves the per-user history in its (-created_at, -id) paging order
+            models.Index(fields=['user', '-created_at', '-id'], name='credittxn_user_ct_idx'),
             models.Index(fields=['interview_request']),
             models.Index(fields=['transaction_type', 'status']),
             models.Index(fields=['status']),
@@ -16,7 +16,9 @@ All operations are atomic and create audit trails.
 """
 
 import logging
+from django.contrib.auth import get_user_model
 from django.db import transaction
+from django.db.models import F
 from django.core.exceptions import ValidationError
 from django.utils import timezone
 
@@ -62,6 +64,30 @@ class CreditService:
             logger.info(f"Created credit balance for user {user.email}")
         return balance
     
+    @staticmethod
+    def get_user_with_credits(user):
+        """
+        Reload a user with everything the credit views read, in two queries.
+        
+        Profile, credit balance and taker earnings are joined and the
+        profile's roles prefetched, so get_balance(), get_taker_earnings()
+        and profile.is_attender()/is_taker() answer without further
+        queries. Missing balance/earnings rows are cached as absent and
+        still raise DoesNotExist on access.
+        
+        Args:
+            user: User instance
+            
+        Returns:
+            User instance
+        """
+        return (
+            get_user_model().objects
+            .select_related('profile', 'credit_balance', 'taker_earnings')
+            .prefetch_related('profile__roles')
+            .get(pk=user.pk)
+        )
+    
     @staticmethod
     def get_balance(user):
         """
@@ -120,6 +146,61 @@ class CreditService:
         )
 
         return True, "Initial credits awarded", txn
+
+    @classmethod
+    @transaction.atomic
+    def award_initial_credits_bulk(cls, user_ids):
+        """
+        Award initial credits to many attenders with set-based queries.
+        
+        The caller is responsible for passing attender user ids only.
+        Missing balances are inserted, the not-yet-credited balances are
+        locked and credited with a single UPDATE, and one transaction
+        record per credited user is bulk inserted. Users credited
+        concurrently (or already credited) are skipped.
+        
+        Args:
+            user_ids: Iterable of user ids
+            
+        Returns:
+            int: Number of users credited
+        """
+        user_ids = list(user_ids)
+        amount = cls.INITIAL_ATTENDER_CREDITS
+
+        CreditBalance.objects.bulk_create(
+            [CreditBalance(user_id=user_id) for user_id in user_ids],
+            ignore_conflicts=True,
+        )
+
+        pending = CreditBalance.objects.filter(
+            user_id__in=user_ids, has_received_initial_credits=False
+        )
+        credit_ids = list(pending.select_for_update().values_list('user_id', flat=True))
+        if not credit_ids:
+            return 0
+
+        CreditBalance.objects.filter(user_id__in=credit_ids).update(
+            balance=F('balance') + amount,
+            total_earned=F('total_earned') + amount,
+            has_received_initial_credits=True,
+            updated_at=timezone.now(),
+        )
+
+        balances = CreditBalance.objects.filter(user_id__in=credit_ids).values_list('user_id', 'balance')
+        CreditTransaction.objects.bulk_create([
+            CreditTransaction(
+                user_id=user_id,
+                transaction_type=TransactionType.INITIAL_CREDIT,
+                status=TransactionStatus.COMPLETED,
+                amount=amount,
+                balance_after=balance,
+                description="Initial credits for attender role",
+            )
+            for user_id, balance in balances
+        ])
+
+        return len(credit_ids)
     
     # ========== INTERVIEW REQUEST (DEBIT TO ESCROW) ==========
     
@@ -29,7 +29,7 @@ logger = logging.getLogger(__name__)
 
 # ========== FIRST LOGIN INITIAL CREDITS ==========
 
-@receiver(user_logged_in)
+@receiver(user_logged_in, dispatch_uid="credits.award_initial_credits_on_first_login")
 def award_initial_credits_on_first_login(sender, user, request, **kwargs):
     """
     Award initial credits when an attender logs in for the first time.
@@ -66,20 +66,21 @@ def award_initial_credits_on_first_login(sender, user, request, **kwargs):
 _interview_status_cache = {}
 
 
-@receiver(pre_save, sender=InterviewRequest)
+@receiver(pre_save, sender=InterviewRequest, dispatch_uid="credits.cache_interview_previous_status")
 def cache_interview_previous_status(sender, instance, **kwargs):
     """Cache the previous status before save to detect changes."""
-    if instance.pk:
-        try:
-            old_instance = InterviewRequest.objects.get(pk=instance.pk)
-            _interview_status_cache[instance.pk] = old_instance.status
-        except InterviewRequest.DoesNotExist:
-            _interview_status_cache[instance.pk] = None
+    if instance.pk and not instance._state.adding:
+        # Only the status column is needed; None if the row is gone
+        _interview_status_cache[instance.pk] = (
+            InterviewRequest.objects.filter(pk=instance.pk)
+            .values_list('status', flat=True)
+            .first()
+        )
     else:
         _interview_status_cache[instance.pk] = None
 
 
-@receiver(post_save, sender=InterviewRequest)
+@receiver(post_save, sender=InterviewRequest, dispatch_uid="credits.handle_interview_status_change")
 def handle_interview_status_change(sender, instance, created, **kwargs):
     """
     Handle credit operations based on interview status changes.
@@ -199,7 +200,7 @@ def handle_interview_status_change(sender, instance, created, **kwargs):
 
 # ========== NEW FEEDBACK SUBMISSION SIGNAL ==========
 
-@receiver(feedback_submitted)
+@receiver(feedback_submitted, dispatch_uid="credits.handle_interviewer_feedback_submission")
 def handle_interviewer_feedback_submission(sender, feedback, interview_request, interviewer, **kwargs):
     """
     Handle credit release when the NEW InterviewerFeedback is submitted.
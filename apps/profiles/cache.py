@@ -0,0 +1,107 @@
+# apps/profiles/cache.py
+"""
+Short-lived cache of the profile fields read on OAuth login redirects.
+
+Entries are written after the OAuth adapter saves a profile and are
+invalidated by the UserProfile post_save signal (see signals.py).
+
+Also holds the per-profile version used to build auth_status ETags and to
+validate the role/onboarding gate cached on the session by
+RoleRequiredMiddleware; it is bumped when the profile, its roles or its
+interviewer/interviewee profiles change.
+
+Interviewer pricing (credits_per_interview by profile public_id) is cached
+briefly for the credits affordability check, which clients call before
+every interview request; InterviewerProfile signals drop it on change.
+"""
+import uuid
+
+from django.core.cache import cache
+
+PROFILE_CACHE_TIMEOUT = 3600  # 1 hour
+
+
+def profile_cache_key(user_id):
+    """Cache key for a user's profile summary."""
+    return f"profile:{user_id}"
+
+
+def cache_profile_summary(profile):
+    """Store the cached summary for ``profile`` and return it."""
+    summary = {
+        "role": profile.role,
+        "is_verified_user": profile.is_verified_user,
+    }
+    cache.set(profile_cache_key(profile.user_id), summary, PROFILE_CACHE_TIMEOUT)
+    return summary
+
+
+def get_profile_summary(user):
+    """Return the cached profile summary for ``user``, loading it on a miss."""
+    from apps.profiles.models import UserProfile
+
+    def load():
+        return (
+            UserProfile.objects.filter(user=user)
+            .values("role", "is_verified_user")
+            .first()
+        )
+
+    return cache.get_or_set(profile_cache_key(user.pk), load, PROFILE_CACHE_TIMEOUT)
+
+
+def invalidate_profile_summary(user_id):
+    """Drop the cached summary for a user."""
+    cache.delete(profile_cache_key(user_id))
+
+
+def payload_version_key(profile_id):
+    """Cache key for a profile's auth_status payload version."""
+    return f"profile-payload-version:{profile_id}"
+
+
+def get_payload_version(profile_id):
+    """Return the current payload version for a profile, starting one if needed."""
+    return cache.get_or_set(
+        payload_version_key(profile_id), lambda: uuid.uuid4().hex, PROFILE_CACHE_TIMEOUT
+    )
+
+
+def invalidate_payload_version(profile_id):
+    """Drop a profile's payload version so the next ETag differs."""
+    cache.delete(payload_version_key(profile_id))
+
+
+INTERVIEWER_CREDITS_CACHE_TIMEOUT = 60  # 1 minute
+
+
+def interviewer_credits_key(public_id):
+    """Cache key for a profile's per-interview price."""
+    return f"interviewer-credits:{public_id}"
+
+
+def get_interviewer_credits(public_id):
+    """
+    Return ``{"credits_per_interview": n}`` for the profile with ``public_id``
+    (0 when it has no interviewer profile), or None if no such profile exists.
+    """
+    from apps.profiles.models import UserProfile
+
+    def load():
+        row = (
+            UserProfile.objects.filter(public_id=public_id)
+            .values_list("pk", "interviewer_profile__credits_per_interview")
+            .first()
+        )
+        if row is None:
+            return None
+        return {"credits_per_interview": row[1] or 0}
+
+    return cache.get_or_set(
+        interviewer_credits_key(public_id), load, INTERVIEWER_CREDITS_CACHE_TIMEOUT
+    )
+
+
+def invalidate_interviewer_credits(public_id):
+    """Drop the cached price for a profile."""
+    cache.delete(interviewer_credits_key(public_id))
@@ -0,0 +1,26 @@
+# Generated by Django 6.0.1 on 2026-10-17 10:30
+
+import uuid
+from django.db import migrations
+
+
+def backfill_public_id(apps, schema_editor):
+    UserProfile = apps.get_model('profiles', 'UserProfile')
+
+    # New profiles get a UUID from the field default; give any legacy rows
+    # without one their own so user_payload no longer has to do it lazily.
+    profiles = list(UserProfile.objects.filter(public_id__isnull=True).only('id'))
+    for profile in profiles:
+        profile.public_id = uuid.uuid4()
+    UserProfile.objects.bulk_update(profiles, ['public_id'], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('profiles', '0017_add_linkedin_email'),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_public_id, migrations.RunPython.noop),
+    ]
@@ -285,16 +285,31 @@ class UserProfile(models.Model):
     
     # ========== MULTI-ROLE HELPER METHODS ==========
     
+    def _prefetched_role_names(self):
+        """Active role names from prefetch_related('roles'), or None if not prefetched."""
+        if 'roles' not in getattr(self, '_prefetched_objects_cache', {}):
+            return None
+        return [role.name for role in self.roles.all() if role.is_active]
+    
     def has_role(self, role_name):
         """Check if user has a specific role."""
+        role_names = self._prefetched_role_names()
+        if role_names is not None:
+            return role_name in role_names
         return self.roles.filter(name=role_name, is_active=True).exists()
     
     def has_any_role(self):
         """Check if user has at least one role assigned."""
+        role_names = self._prefetched_role_names()
+        if role_names is not None:
+            return bool(role_names)
         return self.roles.filter(is_active=True).exists()
     
     def get_role_names(self):
         """Get list of role names for the user."""
+        role_names = self._prefetched_role_names()
+        if role_names is not None:
+            return role_names
         return list(self.roles.filter(is_active=True).values_list('name', flat=True))
     
     def get_roles(self):
@@ -1,4 +1,60 @@
 # apps/profiles/signals.py
-# Profile signals moved to accounts/signals.py to avoid duplicates
-# This file can be used for profile-specific signals in the future
-from django.dispatch import receiver
\ No newline at end of file
+# Profile creation signals live in accounts/signals.py to avoid duplicates
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import receiver
+
+from apps.profiles.cache import (
+    invalidate_interviewer_credits,
+    invalidate_payload_version,
+    invalidate_profile_summary,
+)
+from apps.profiles.models import IntervieweeProfile, InterviewerProfile, UserProfile
+
+
+@receiver(post_save, sender=UserProfile)
+def invalidate_cached_profile(sender, instance, **kwargs):
+    """Drop the cached profile summary and payload version whenever the profile is saved."""
+    invalidate_profile_summary(instance.user_id)
+    invalidate_payload_version(instance.pk)
+
+
+@receiver(m2m_changed, sender=UserProfile.roles.through)
+def invalidate_payload_on_roles_change(sender, instance, action, reverse, pk_set, **kwargs):
+    """Role changes alter user_payload without touching the profile row."""
+    if not reverse:
+        if action.startswith("post_"):
+            invalidate_payload_version(instance.pk)
+        return
+
+    # Changed from the Role side: pk_set holds the profile ids, except on
+    # clear, where the affected profiles must be read before they go
+    if action in ("post_add", "post_remove"):
+        profile_ids = pk_set
+    elif action == "pre_clear":
+        profile_ids = instance.profiles.values_list("pk", flat=True)
+    else:
+        return
+    for profile_id in profile_ids:
+        invalidate_payload_version(profile_id)
+
+
+@receiver(post_save, sender=IntervieweeProfile)
+@receiver(post_save, sender=InterviewerProfile)
+@receiver(post_delete, sender=IntervieweeProfile)
+@receiver(post_delete, sender=InterviewerProfile)
+def invalidate_payload_on_role_profile_change(sender, instance, **kwargs):
+    """Onboarding status depends on the role-specific profiles."""
+    invalidate_payload_version(instance.user_profile_id)
+
+
+@receiver(post_save, sender=InterviewerProfile)
+@receiver(post_delete, sender=InterviewerProfile)
+def invalidate_interviewer_credits_on_change(sender, instance, **kwargs):
+    """The cached price is keyed by the owning profile's public_id."""
+    public_id = (
+        UserProfile.objects.filter(pk=instance.user_profile_id)
+        .values_list("public_id", flat=True)
+        .first()
+    )
+    if public_id is not None:
+        invalidate_interviewer_credits(public_id)
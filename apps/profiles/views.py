@@ -35,7 +35,10 @@ AVAILABLE_ROLES = [
 def select_role_view(request):
     user = request.user
 
-    profile, _ = UserProfile.objects.get_or_create(user=user)
+    try:
+        profile = user.profile
+    except UserProfile.DoesNotExist:
+        profile, _ = UserProfile.objects.get_or_create(user=user)
 
     # GET → onboarding info
     if request.method == "GET":
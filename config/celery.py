@@ -0,0 +1,16 @@
+# config/celery.py
+"""
+Celery application for background tasks.
+
+Reads CELERY_* settings from config.settings and discovers tasks.py modules
+in installed apps. Run a worker with: celery -A config worker
+"""
+import os
+
+from celery import Celery
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
+
+app = Celery("config")
+app.config_from_object("django.conf:settings", namespace="CELERY")
+app.autodiscover_tasks()
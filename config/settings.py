@@ -9,6 +9,9 @@ SIMPLE_JWT = {
     "AUTH_HEADER_TYPES": ("Bearer",),
     "AUTH_TOKEN_CLASSES": ("rest_framework_simplejwt.tokens.AccessToken",),
     "TOKEN_TYPE_CLAIM": "token_type",
+    # HMAC signing: each token costs one cheap SHA-256 HMAC (no RSA key to
+    # load or sign with), which keeps issue_tokens() off the login hot path
+    "ALGORITHM": "HS256",
     "BLACKLIST_AFTER_ROTATION": True,
 }
 BASE_DIR = Path(__file__).resolve().parent.parent
@@ -20,6 +23,9 @@ SECRET_KEY = env("SECRET_KEY")
 
 DEBUG = env.bool("DEBUG", default=False)
 
+# Log LinkedIn OAuth exceptions in detail (AllauthDebugMiddleware)
+ALLAUTH_DEBUG = env.bool("ALLAUTH_DEBUG", default=DEBUG)
+
 AUTH_USER_MODEL = "accounts.User"
 
 # Use environment variable with fallback for development
@@ -35,9 +41,20 @@ DATABASES = {
         "PASSWORD": env("DB_PASSWORD"),
         "HOST": env("DB_HOST"),
         "PORT": env("DB_PORT"),
+        # Keep connections open between requests instead of reconnecting
+        # (TCP + auth handshake) for every request; 0 restores the default.
+        "CONN_MAX_AGE": env.int("DJANGO_MAX_CONN_AGE", default=60),
+        "CONN_HEALTH_CHECKS": True,
     }
 }
 
+# Shared cache: signal handlers invalidate entries (SocialApp lookups,
+# verified login emails, profile payloads, interviewer credits) from
+# whichever process did the write, so every web/worker/management process
+# must see the same store. Defaults to the database cache table (created by
+# accounts migration 0006); set CACHE_URL=rediscache://... to use Redis.
+CACHES = {"default": env.cache("CACHE_URL", default="dbcache://django_cache")}
+
 ROOT_URLCONF = "config.urls"
 
 MIDDLEWARE = [
@@ -88,7 +105,8 @@ INSTALLED_APPS = [
 
 REST_FRAMEWORK = {
     "DEFAULT_AUTHENTICATION_CLASSES": [
-        "rest_framework_simplejwt.authentication.JWTAuthentication",
+        # simplejwt JWTAuthentication that also joins the user's profile
+        "apps.accounts.authentication.ProfileJWTAuthentication",
         "rest_framework.authentication.SessionAuthentication",
         #'rest_framework.authentication.BasicAuthentication',
     ],
@@ -184,6 +202,10 @@ SITE_ID = 2  # localhost:8000
 AUTHENTICATION_BACKENDS = (
     "apps.accounts.backends.EmailBackend",
     "django.contrib.auth.backends.ModelBackend",
+    # Joins the profile when loading request.user; allauth logs OAuth users in
+    # with the first AuthenticationBackend subclass listed here
+    "apps.accounts.backends.ProfileAuthenticationBackend",
+    # Kept so sessions created before ProfileAuthenticationBackend stay valid
     "allauth.account.auth_backends.AuthenticationBackend",
 )
 
@@ -396,6 +418,14 @@ ASGI_APPLICATION = "config.asgi.application"
 # For development (in-memory layer):
 CHANNEL_LAYERS = {"default": {"BACKEND": "channels.layers.InMemoryChannelLayer"}}
 
+# ========== CELERY CONFIGURATION ==========
+# Background tasks are only queued when a broker is configured (and the
+# Procfile "worker" process is running); without one they run inline.
+CELERY_BROKER_URL = env("CELERY_BROKER_URL", default="")
+CELERY_TASK_IGNORE_RESULT = True
+CELERY_ACCEPT_CONTENT = ["json"]
+CELERY_TASK_SERIALIZER = "json"
+
 # Celery Beat Periodic Tasks Schedule
 CELERY_BEAT_SCHEDULE = {
     # Main task: Finalize accepted interviews that have expired (20-min rule)